@@ -23,8 +23,4 @@ for svc in detection policy review; do
     cd "services/$svc" && pip install -e ".[dev]" && cd ../..
 done
 
-# Download spaCy model for detection
-echo "[*] Downloading spaCy model..."
-python -m spacy download en_core_web_sm
-
 echo "=== Setup complete ==="
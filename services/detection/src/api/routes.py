@@ -2,45 +2,62 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
 from ..engine.pipeline import DetectionPipeline
 from ..models import AnalyzeRequest, AnalyzeResponse, BatchAnalyzeRequest, BatchAnalyzeResponse
 
 router = APIRouter()
 
-# Singleton pipeline instance
-_pipeline = DetectionPipeline()
+
+def get_pipeline(request: Request) -> DetectionPipeline:
+    """The pipeline instance created by the app lifespan."""
+    return request.app.state.pipeline
 
 
 @router.post("/analyze", response_model=AnalyzeResponse)
-async def analyze_message(request: AnalyzeRequest) -> AnalyzeResponse:
+async def analyze_message(
+    request: AnalyzeRequest,
+    pipeline: DetectionPipeline = Depends(get_pipeline),
+) -> AnalyzeResponse:
     """Analyze a single chat message for contact information exchange attempts."""
     try:
-        result = await _pipeline.analyze(request)
+        result = await pipeline.analyze(request)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
 @router.post("/analyze/batch", response_model=BatchAnalyzeResponse)
-async def analyze_batch(request: BatchAnalyzeRequest) -> BatchAnalyzeResponse:
-    """Analyze multiple messages in batch."""
-    results = []
-    for msg in request.messages:
-        try:
-            result = await _pipeline.analyze(msg)
-            results.append(result)
-        except Exception:
-            # On individual failure, return zero-score result
-            results.append(AnalyzeResponse(
-                message_id=msg.message_id,
-                risk_score=0.0,
-                labels=["analysis_error"],
-                evidence_spans=[],
-                hashed_tokens=[],
-                stage=0,
-                ruleset_version="1.0.0",
-                processing_ms=0,
-            ))
-    return BatchAnalyzeResponse(results=results)
+async def analyze_batch(
+    request: BatchAnalyzeRequest,
+    pipeline: DetectionPipeline = Depends(get_pipeline),
+) -> Response:
+    """Analyze multiple messages in batch.
+
+    The response is serialized straight to JSON by pydantic-core; returning a
+    Response skips FastAPI's re-validation and stdlib json encoding of up to
+    50 results. ``response_model`` still documents the schema.
+    """
+    results = await asyncio.gather(*(_safe_analyze(pipeline, msg) for msg in request.messages))
+    body = BatchAnalyzeResponse(results=list(results)).model_dump_json()
+    return Response(content=body, media_type="application/json")
+
+
+async def _safe_analyze(pipeline: DetectionPipeline, msg: AnalyzeRequest) -> AnalyzeResponse:
+    try:
+        return await pipeline.analyze(msg)
+    except Exception:
+        # On individual failure, return zero-score result
+        return AnalyzeResponse(
+            message_id=msg.message_id,
+            risk_score=0.0,
+            labels=["analysis_error"],
+            evidence_spans=[],
+            hashed_tokens=[],
+            stage=0,
+            ruleset_version="1.0.0",
+            processing_ms=0,
+        )
@@ -12,6 +12,7 @@ class Settings:
 
     REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
     REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
+    REDIS_PASSWORD: str = os.getenv("REDIS_PASSWORD", "")
 
     DETECTION_PORT: int = int(os.getenv("DETECTION_PORT", "8001"))
     LOG_LEVEL: str = os.getenv("DETECTION_LOG_LEVEL", "info")
@@ -26,6 +27,15 @@ class Settings:
     STAGE2_WEIGHT: float = float(os.getenv("STAGE2_WEIGHT", "0.30"))
     STAGE3_WEIGHT: float = float(os.getenv("STAGE3_WEIGHT", "0.20"))
 
+    # Stage 1 score at or above which Stage 3 is skipped (> 1.0 disables)
+    STAGE_SHORTCIRCUIT_THRESHOLD: float = float(os.getenv("STAGE_SHORTCIRCUIT_THRESHOLD", "0.90"))
+
+    # Stage 3 behavioral state: "memory" (per-process) or "redis" (shared by all workers)
+    BEHAVIORAL_BACKEND: str = os.getenv("BEHAVIORAL_BACKEND", "memory")
+
+    # Number of recent Stage 1 results memoized by message content
+    STAGE1_CACHE_SIZE: int = int(os.getenv("STAGE1_CACHE_SIZE", "4096"))
+
     @property
     def database_url(self) -> str:
         return (
@@ -2,15 +2,33 @@
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
+import logging
 import time
-from typing import Optional
+from functools import lru_cache
+from typing import Awaitable, Optional
 
 from ..config import settings
 from ..models import AnalyzeRequest, AnalyzeResponse, EvidenceSpan, EvidenceType, StageResult
 from .stage1_rules import run_stage1
 from .stage2_nlp import run_stage2
-from .stage3_behavioral import run_stage3, BehavioralContext
+from .stage3_behavioral import run_stage3, make_behavioral_context
+
+logger = logging.getLogger(__name__)
+
+# Stage 1 is a pure function of the message text, and chat traffic repeats a lot
+# (canned phrases, quoted replies, spam), so memoize recent results.
+_stage1_cache = lru_cache(maxsize=settings.STAGE1_CACHE_SIZE)(run_stage1)
+
+
+def _run_stage1_cached(text: str) -> StageResult:
+    """Run Stage 1 through the cache, returning a copy the caller may mutate."""
+    cached = _stage1_cache(text)
+    return cached.model_copy(update={
+        "labels": list(cached.labels),
+        "evidence_spans": [span.model_copy() for span in cached.evidence_spans],
+        "hashed_tokens": list(cached.hashed_tokens),
+    })
 
 
 class DetectionPipeline:
@@ -21,11 +39,17 @@ class DetectionPipeline:
         stage1_weight: float = settings.STAGE1_WEIGHT,
         stage2_weight: float = settings.STAGE2_WEIGHT,
         stage3_weight: float = settings.STAGE3_WEIGHT,
+        shortcircuit_threshold: float = settings.STAGE_SHORTCIRCUIT_THRESHOLD,
     ):
         self.stage1_weight = stage1_weight
         self.stage2_weight = stage2_weight
         self.stage3_weight = stage3_weight
-        self.behavioral_context = BehavioralContext()
+        self.shortcircuit_threshold = shortcircuit_threshold
+        self.behavioral_context = make_behavioral_context()
+
+    def close(self) -> None:
+        """Release the behavioral store's connections."""
+        self.behavioral_context.close()
 
     async def analyze(
         self,
@@ -50,21 +74,41 @@ class DetectionPipeline:
         stage_results: list[StageResult] = []
         highest_stage = 0
         model_version: Optional[str] = None
+        skip_stage3 = False
 
-        # Stage 1: Deterministic rules
+        # Stages 1 and 2 are independent: run Stage 1 (CPU-bound) in the executor
+        # while Stage 2 runs on the event loop, then merge results in stage order.
+        loop = asyncio.get_running_loop()
+        pending: dict[int, Awaitable[StageResult]] = {}
         if 1 in run_stages:
-            s1 = run_stage1(request.content)
+            pending[1] = loop.run_in_executor(None, _run_stage1_cached, request.content)
+        if 2 in run_stages:
+            context_texts = [m.content for m in request.context_messages]
+            pending[2] = run_stage2(request.content, context_texts)
+        completed = dict(zip(pending, await asyncio.gather(*pending.values())))
+
+        # Stage 1: Deterministic rules
+        if 1 in completed:
+            s1 = completed[1]
             stage_results.append(s1)
             all_labels.extend(s1.labels)
             all_evidence.extend(s1.evidence_spans)
-            all_hashed.extend(s1.hashed_tokens)
+            all_hashed.extend(s1.hashed_tokens)  # already distinct
             if s1.score > 0:
                 highest_stage = 1
+            # An explicit contact detail is conclusive on its own: skip the
+            # Stage 3 lookup. Stage 3 keeps its weight and scores 0, as it
+            # does for a user with no history.
+            if s1.score >= self.shortcircuit_threshold and 3 in run_stages:
+                skip_stage3 = True
+                logger.debug(
+                    "Stage 1 conclusive for message %s, skipping Stage 3",
+                    request.message_id,
+                )
 
         # Stage 2: NLP intent classification
-        if 2 in run_stages:
-            context_texts = [m.content for m in request.context_messages]
-            s2 = await run_stage2(request.content, context_texts)
+        if 2 in completed:
+            s2 = completed[2]
             stage_results.append(s2)
             all_labels.extend(s2.labels)
             all_evidence.extend(s2.evidence_spans)
@@ -74,13 +118,17 @@ class DetectionPipeline:
                 highest_stage = max(highest_stage, 2)
 
         # Stage 3: Behavioral analysis
-        if 3 in run_stages:
-            s3 = run_stage3(
+        if 3 in run_stages and not skip_stage3:
+            stage3_args = (
                 request.content,
                 request.user_id,
                 request.thread_id,
                 self.behavioral_context,
             )
+            if self.behavioral_context.remote:
+                s3 = await loop.run_in_executor(None, run_stage3, *stage3_args)
+            else:
+                s3 = run_stage3(*stage3_args)
             stage_results.append(s3)
             all_labels.extend(s3.labels)
             all_evidence.extend(s3.evidence_spans)
@@ -93,9 +141,6 @@ class DetectionPipeline:
         # Deduplicate labels
         unique_labels = list(dict.fromkeys(all_labels))
 
-        # Hash sensitive tokens
-        unique_hashed = list(dict.fromkeys(all_hashed))
-
         processing_ms = _now_ms() - start_ms
 
         return AnalyzeResponse(
@@ -103,7 +148,7 @@ class DetectionPipeline:
             risk_score=round(combined_score, 3),
             labels=unique_labels,
             evidence_spans=all_evidence,
-            hashed_tokens=unique_hashed,
+            hashed_tokens=all_hashed,
             stage=highest_stage if highest_stage > 0 else 1,
             ruleset_version=settings.RULESET_VERSION,
             model_version=model_version,
@@ -146,10 +191,5 @@ class DetectionPipeline:
         return min(weighted_sum, 1.0)
 
 
-def hash_token(value: str) -> str:
-    """SHA-256 hash a detected contact value for storage."""
-    return hashlib.sha256(value.strip().lower().encode()).hexdigest()
-
-
 def _now_ms() -> int:
     return int(time.time() * 1000)
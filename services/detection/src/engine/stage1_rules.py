@@ -5,7 +5,7 @@ from __future__ import annotations
 import hashlib
 
 from ..models import EvidenceSpan, EvidenceType, StageResult
-from ..patterns.phone import detect as detect_phone
+from ..patterns.phone import PatternMatch, detect as detect_phone
 from ..patterns.email import detect as detect_email
 from ..patterns.url import detect as detect_url
 from ..patterns.social import detect as detect_social
@@ -33,17 +33,31 @@ _TYPE_WEIGHT = {
     "obfuscation": 0.15,  # Obfuscation alone is just a signal
 }
 
+# Detection types that carry an actual contact value
+_CONTACT_TYPES = frozenset({"phone", "email", "url", "social"})
+
+# Label emitted for each detection type
+_LABEL_MAP = {
+    "phone": "phone_number",
+    "email": "email_address",
+    "url": "url_link",
+    "social": "social_handle",
+    "intent": "intent_phrase",
+    "obfuscation": "obfuscation",
+}
+
 
 def run_stage1(text: str) -> StageResult:
     """Run all deterministic pattern detections against the text.
 
     1. First deobfuscate the text (normalize unicode tricks).
-    2. Run pattern detectors on both original and deobfuscated text.
+    2. Run pattern detectors on the original text, and again on the
+       deobfuscated text.
     3. Combine results, dedup, and compute a score.
     """
     labels: list[str] = []
     evidence: list[EvidenceSpan] = []
-    hashed_tokens: list[str] = []
+    token_values: dict[str, None] = {}
 
     # Check for obfuscation first
     obfuscation_matches = detect_obfuscation(text)
@@ -60,11 +74,18 @@ def run_stage1(text: str) -> StageResult:
     all_matches.extend(detect_social(text))
     all_matches.extend(detect_intent(text))
 
-    # If text was obfuscated, also run on clean version
+    # Phone/email read '@', '(' and '[' as separators, so they get a clean
+    # copy that keeps leet symbols: "j0hn (at) gmail (dot) c0m" becomes
+    # "john (at) gmail (dot) com" rather than "john cat) gmail cdot) com"
+    contact_text = deobfuscate(text, keep_symbols=True)
+    if contact_text != text:
+        all_matches.extend(detect_phone(contact_text))
+        all_matches.extend(detect_email(contact_text))
+
+    # If text was obfuscated, also run the word-based detectors on the clean
+    # version
     if clean_text != text:
-        all_matches.extend(detect_phone(clean_text))
-        all_matches.extend(detect_email(clean_text))
-        all_matches.extend(detect_url(clean_text))
+        all_matches.extend(_letter_urls(text, clean_text))
         all_matches.extend(detect_social(clean_text))
         all_matches.extend(detect_intent(clean_text))
 
@@ -72,13 +93,13 @@ def run_stage1(text: str) -> StageResult:
         labels.append("obfuscation")
 
     # Deduplicate by (type, offset) — keep highest confidence
-    seen: dict[tuple[str, int], float] = {}
-    unique_matches = []
+    best: dict[tuple[str, int], PatternMatch] = {}
     for m in all_matches:
         key = (m.type, m.offset)
-        if key not in seen or m.confidence > seen[key]:
-            seen[key] = m.confidence
-            unique_matches.append(m)
+        current = best.get(key)
+        if current is None or m.confidence > current.confidence:
+            best[key] = m
+    unique_matches = list(best.values())
 
     # Build evidence spans and labels
     seen_labels: set[str] = set()
@@ -96,11 +117,11 @@ def run_stage1(text: str) -> StageResult:
             labels.append(label)
             seen_labels.add(label)
 
-        # Hash the matched value for storage
-        if m.value and m.type in ("phone", "email", "url", "social"):
-            token_hash = hashlib.sha256(m.value.strip().lower().encode()).hexdigest()
-            if token_hash not in hashed_tokens:
-                hashed_tokens.append(token_hash)
+        # Collect matched contact values for hashing (each distinct value once)
+        if m.value and m.type in _CONTACT_TYPES:
+            token_values.setdefault(m.value.strip().lower(), None)
+
+    hashed_tokens = [_sha256_hex(v) for v in token_values]
 
     # Compute score based on weighted combination of detected types
     score = _compute_score(unique_matches, has_obfuscation)
@@ -114,6 +135,23 @@ def run_stage1(text: str) -> StageResult:
     )
 
 
+def _letter_urls(text: str, clean_text: str) -> list[PatternMatch]:
+    """URL matches in ``clean_text``, minus numbers leet-decoded into hosts.
+
+    Deobfuscation reads digits as letters, so "555.123.4567" becomes
+    "sss.ize.asb7"; a match that only covers digits and punctuation in the
+    original text is dropped. Offsets only line up when deobfuscation kept
+    the length, so other matches are kept as they are.
+    """
+    matches = detect_url(clean_text)
+    if len(clean_text) != len(text):
+        return matches
+    return [
+        m for m in matches
+        if any(c.isalpha() for c in text[m.offset:m.offset + m.length])
+    ]
+
+
 def _compute_score(matches: list, has_obfuscation: bool) -> float:
     """Compute a risk score from pattern matches.
 
@@ -131,7 +169,7 @@ def _compute_score(matches: list, has_obfuscation: bool) -> float:
     for m in matches:
         base_weight = _TYPE_WEIGHT.get(m.type, 0.3)
         effective = base_weight * m.confidence
-        if m.type not in type_scores or effective > type_scores[m.type]:
+        if effective > type_scores.get(m.type, -1.0):
             type_scores[m.type] = effective
 
     if not type_scores:
@@ -141,7 +179,7 @@ def _compute_score(matches: list, has_obfuscation: bool) -> float:
     base_score = max(type_scores.values())
 
     # Multi-type boost: +0.10 for each additional contact-type detection
-    contact_types = {t for t in type_scores if t in ("phone", "email", "url", "social")}
+    contact_types = type_scores.keys() & _CONTACT_TYPES
     multi_boost = min(0.15, 0.08 * (len(contact_types) - 1)) if len(contact_types) > 1 else 0.0
 
     # Obfuscation boost: if user is trying to hide, increase suspicion
@@ -151,13 +189,14 @@ def _compute_score(matches: list, has_obfuscation: bool) -> float:
     return min(total, 1.0)
 
 
+def hash_token(value: str) -> str:
+    """SHA-256 hash a detected contact value for storage."""
+    return _sha256_hex(value.strip().lower())
+
+
+def _sha256_hex(normalized_value: str) -> str:
+    return hashlib.sha256(normalized_value.encode()).hexdigest()
+
+
 def _label_for_type(pattern_type: str) -> str | None:
-    label_map = {
-        "phone": "phone_number",
-        "email": "email_address",
-        "url": "url_link",
-        "social": "social_handle",
-        "intent": "intent_phrase",
-        "obfuscation": "obfuscation",
-    }
-    return label_map.get(pattern_type)
+    return _LABEL_MAP.get(pattern_type)
@@ -1,4 +1,4 @@
-"""Stage 2: NLP intent classification using spaCy."""
+"""Stage 2: NLP intent classification — keyword clusters plus NER-lite heuristics."""
 
 from __future__ import annotations
 
@@ -7,25 +7,38 @@ from typing import Optional
 
 from ..models import EvidenceSpan, EvidenceType, StageResult
 
-# Lazy-load spaCy to avoid import overhead if stage 2 isn't used
-_nlp = None
-_MODEL_NAME = "en_core_web_sm"
-_MODEL_VERSION = "spacy-3.7-sm"
-
-
-def _get_nlp():
-    global _nlp
-    if _nlp is None:
-        try:
-            import spacy
-            _nlp = spacy.load(_MODEL_NAME)
-        except OSError:
-            # Model not installed — return None, stage will produce zero score
-            _nlp = False
-    return _nlp if _nlp is not False else None
-
-
-# Intent keyword clusters with weights
+# Prefer RE2 (linear-time, no backtracking) for scanning user-controlled content;
+# fall back to the stdlib engine if the optional dependency isn't installed.
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+# Version tag for the entity heuristics below (reported as the Stage 2 model)
+_MODEL_VERSION = "ner-lite-1.0"
+
+# Contact-intent verbs and their inflections
+_CONTACT_VERBS = frozenset({
+    "call", "calls", "called", "calling",
+    "text", "texts", "texted", "texting",
+    "email", "emails", "emailed", "emailing",
+    "message", "messages", "messaged", "messaging",
+    "contact", "contacts", "contacted", "contacting",
+    "reach", "reaches", "reached", "reaching",
+})
+
+# NER-lite: 7+ digits, optionally single-space separated (phone-like cardinal)
+_LONG_DIGITS = _regex.compile(r"\b\d(?:\s?\d){6,}\b")
+# Capitalized word that could be a person or organization name
+_NAME_WORD = re.compile(r"[A-Z][a-z]+")
+_WORD_PUNCTUATION = ".,!?;:\"'()"
+_NAME_VERB_WINDOW = 5
+
+
+# Intent keyword clusters with weights.
+# Keep these RE2-compatible: no lookarounds, backreferences, atomic groups or
+# possessive quantifiers. RE2 already rules out catastrophic backtracking, and
+# it rejects that syntax outright rather than falling back.
 _INTENT_CLUSTERS = {
     "direct_request": {
         "keywords": [
@@ -61,6 +74,18 @@ _INTENT_CLUSTERS = {
     },
 }
 
+# Compiled once at import: (cluster_name, weight, union of the cluster's keywords).
+# One alternation per cluster lets the engine walk the text once per cluster
+# while keeping clusters independent, so one cluster's match never masks another's.
+_COMPILED_CLUSTERS: list[tuple[str, float, "re.Pattern[str]"]] = [
+    (
+        name,
+        cluster["weight"],
+        _regex.compile("(?i)" + "|".join(f"(?:{p})" for p in cluster["keywords"])),
+    )
+    for name, cluster in _INTENT_CLUSTERS.items()
+]
+
 
 async def run_stage2(
     text: str,
@@ -68,7 +93,7 @@ async def run_stage2(
 ) -> StageResult:
     """Run NLP intent classification on the message.
 
-    Combines keyword-cluster matching with spaCy NER/dependency features
+    Combines keyword-cluster matching with lightweight entity heuristics
     for more nuanced intent detection.
     """
     labels: list[str] = []
@@ -77,19 +102,15 @@ async def run_stage2(
 
     # Keyword cluster matching
     cluster_scores: dict[str, float] = {}
-    for cluster_name, cluster in _INTENT_CLUSTERS.items():
-        for pattern in cluster["keywords"]:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
-            if matches:
-                cluster_scores[cluster_name] = cluster["weight"]
-                for m in matches:
-                    evidence.append(EvidenceSpan(
-                        offset=m.start(),
-                        length=m.end() - m.start(),
-                        type=EvidenceType.INTENT,
-                        confidence=cluster["weight"],
-                    ))
-                break  # One match per cluster is enough
+    for cluster_name, weight, pattern in _COMPILED_CLUSTERS:
+        for m in pattern.finditer(text):
+            cluster_scores[cluster_name] = weight
+            evidence.append(EvidenceSpan(
+                offset=m.start(),
+                length=m.end() - m.start(),
+                type=EvidenceType.INTENT,
+                confidence=weight,
+            ))
 
     if cluster_scores:
         # Use the max cluster score as the base
@@ -108,45 +129,48 @@ async def run_stage2(
         if context_score > 0.3:
             labels.append("context_escalation")
 
-    # spaCy NER analysis for entity detection
-    nlp_score = _spacy_analysis(text)
-    if nlp_score > 0:
-        combined_score = max(combined_score, nlp_score * 0.6)
-
-    model_version = _MODEL_VERSION if _get_nlp() else None
+    # Entity heuristics (phone-like numbers, names near contact verbs)
+    entity_score = _entity_analysis(text)
+    if entity_score > 0:
+        combined_score = max(combined_score, entity_score * 0.6)
 
     return StageResult(
         stage=2,
         score=round(min(combined_score, 1.0), 3),
         labels=labels,
         evidence_spans=evidence,
-        model_version=model_version,
+        model_version=_MODEL_VERSION,
     )
 
 
-def _spacy_analysis(text: str) -> float:
-    """Use spaCy NER to detect contact-like entities."""
-    nlp = _get_nlp()
-    if nlp is None:
-        return 0.0
+def _entity_analysis(text: str) -> float:
+    """Detect contact-like entities without an NER model.
 
-    doc = nlp(text)
-    score = 0.0
+    - A run of 7+ digits reads as a phone number (0.5).
+    - A capitalized, non-sentence-initial word within a few words of a
+      contact verb reads as a name being passed along (0.4).
+    """
+    if _LONG_DIGITS.search(text):
+        return 0.5
 
-    for ent in doc.ents:
-        # PERSON entities near contact-intent verbs
-        if ent.label_ in ("PERSON", "ORG"):
-            # Check if nearby tokens suggest contact exchange
-            for token in doc:
-                if token.lemma_ in ("call", "text", "email", "message", "contact", "reach"):
-                    if abs(token.i - ent.start) < 5:
-                        score = max(score, 0.4)
+    raw_words = text.split()
+    words = [w.strip(_WORD_PUNCTUATION) for w in raw_words]
+    verb_positions = [i for i, w in enumerate(words) if w.lower() in _CONTACT_VERBS]
+    if not verb_positions:
+        return 0.0
 
-        # CARDINAL entities that could be phone numbers
-        if ent.label_ == "CARDINAL" and len(ent.text.replace(" ", "")) >= 7:
-            score = max(score, 0.5)
+    sentence_start = True
+    for i, (raw, word) in enumerate(zip(raw_words, words)):
+        if (
+            not sentence_start
+            and _NAME_WORD.fullmatch(word)
+            and word.lower() not in _CONTACT_VERBS
+            and any(abs(i - v) < _NAME_VERB_WINDOW for v in verb_positions)
+        ):
+            return 0.4
+        sentence_start = raw.endswith((".", "!", "?"))
 
-    return score
+    return 0.0
 
 
 def _analyze_context(context_texts: list[str]) -> float:
@@ -156,11 +180,9 @@ def _analyze_context(context_texts: list[str]) -> float:
 
     context_hits = 0
     for ctx in context_texts[-5:]:  # Look at last 5 messages
-        for cluster in _INTENT_CLUSTERS.values():
-            for pattern in cluster["keywords"]:
-                if re.search(pattern, ctx, re.IGNORECASE):
-                    context_hits += 1
-                    break
+        for _, _, pattern in _COMPILED_CLUSTERS:
+            if pattern.search(ctx):
+                context_hits += 1
 
     if context_hits == 0:
         return 0.0
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import logging
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Optional
 
+from ..config import settings
 from ..models import EvidenceSpan, EvidenceType, StageResult
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class UserThreadHistory:
     """Tracks detection history for a user in a thread."""
     detection_count: int = 0
@@ -22,15 +26,19 @@ class UserThreadHistory:
 class BehavioralContext:
     """In-memory store for behavioral context across messages.
 
-    In production, this would be backed by Redis for cross-instance state.
+    State is per-process; use RedisBehavioralContext when running several
+    workers or instances.
     """
 
+    # Lookups are local; safe to call from the event loop
+    remote = False
+
     def __init__(self, window_seconds: int = 3600):
         self.window_seconds = window_seconds
-        # user_id -> thread_id -> history
-        self._user_threads: dict[str, dict[str, UserThreadHistory]] = defaultdict(
-            lambda: defaultdict(UserThreadHistory)
-        )
+        # (user_id, thread_id) -> history
+        self._user_threads: dict[tuple[str, str], UserThreadHistory] = {}
+        # user_id -> thread_ids with recorded detections
+        self._user_thread_ids: dict[str, set[str]] = defaultdict(set)
         # user_id -> global detection count (across all threads)
         self._user_global: dict[str, int] = defaultdict(int)
 
@@ -42,7 +50,11 @@ class BehavioralContext:
     ) -> None:
         """Record a detection event for behavioral tracking."""
         now = time.time()
-        h = self._user_threads[user_id][thread_id]
+        key = (user_id, thread_id)
+        h = self._user_threads.get(key)
+        if h is None:
+            h = self._user_threads[key] = UserThreadHistory()
+            self._user_thread_ids[user_id].add(thread_id)
         h.detection_count += 1
         h.last_detection_ts = now
         h.types_seen.update(detected_types)
@@ -50,21 +62,151 @@ class BehavioralContext:
         self._user_global[user_id] += 1
 
     def get_history(self, user_id: str, thread_id: str) -> UserThreadHistory:
-        return self._user_threads[user_id][thread_id]
+        """Return the user's history in a thread (empty if nothing was recorded)."""
+        return self._user_threads.get((user_id, thread_id)) or UserThreadHistory()
 
     def get_global_count(self, user_id: str) -> int:
         return self._user_global.get(user_id, 0)
 
     def get_thread_count(self, user_id: str) -> int:
         """How many distinct threads has this user had detections in?"""
-        return len(self._user_threads.get(user_id, {}))
+        return len(self._user_thread_ids.get(user_id, ()))
+
+    def lookup(self, user_id: str, thread_id: str) -> tuple[UserThreadHistory, int, int]:
+        """The thread history, global count and thread count Stage 3 reads."""
+        return (
+            self.get_history(user_id, thread_id),
+            self.get_global_count(user_id),
+            self.get_thread_count(user_id),
+        )
+
+    def close(self) -> None:
+        """Nothing to release; the history lives in this process."""
+
+
+class RedisBehavioralContext:
+    """Redis-backed store for behavioral context, shared across workers.
+
+    Keys (all expire after ``window_seconds`` without new detections):
+        cis:bh:{user}:t:{thread}        hash: detection_count, message_count, last_detection_ts
+        cis:bh:{user}:t:{thread}:types  set of detected types
+        cis:bh:{user}:threads           set of thread_ids with detections
+        cis:bh:{user}:global            detection count across all threads
+
+    Fails open: if Redis is unavailable, lookup() reports no history and
+    record() drops the event, so Stage 3 scores 0 instead of failing the
+    analysis.
+    """
+
+    # Lookups are network round trips; keep them off the event loop
+    remote = True
+
+    _PREFIX = "cis:bh"
+
+    def __init__(self, client=None, window_seconds: int = 3600):
+        import redis
+
+        if client is None:
+            client = redis.Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                password=settings.REDIS_PASSWORD or None,
+                decode_responses=True,
+            )
+        self._redis = client
+        self._redis_error = redis.RedisError
+        self.window_seconds = window_seconds
+
+    def _thread_key(self, user_id: str, thread_id: str) -> str:
+        return f"{self._PREFIX}:{user_id}:t:{thread_id}"
+
+    def _user_key(self, user_id: str, suffix: str) -> str:
+        return f"{self._PREFIX}:{user_id}:{suffix}"
+
+    def record(
+        self,
+        user_id: str,
+        thread_id: str,
+        detected_types: list[str],
+    ) -> None:
+        """Record a detection event atomically (single MULTI/EXEC round trip)."""
+        key = self._thread_key(user_id, thread_id)
+        types_key = f"{key}:types"
+        threads_key = self._user_key(user_id, "threads")
+        global_key = self._user_key(user_id, "global")
+
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.hincrby(key, "detection_count", 1)
+        pipe.hincrby(key, "message_count", 1)
+        pipe.hset(key, "last_detection_ts", time.time())
+        if detected_types:
+            pipe.sadd(types_key, *detected_types)
+        pipe.sadd(threads_key, thread_id)
+        pipe.incr(global_key)
+        for k in (key, types_key, threads_key, global_key):
+            pipe.expire(k, self.window_seconds)
+        try:
+            pipe.execute()
+        except self._redis_error as exc:
+            logger.warning("Behavioral store unavailable, detection not recorded: %s", exc)
+
+    def get_history(self, user_id: str, thread_id: str) -> UserThreadHistory:
+        key = self._thread_key(user_id, thread_id)
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hgetall(key)
+        pipe.smembers(f"{key}:types")
+        fields, types_seen = pipe.execute()
+        return _history(fields, types_seen)
+
+    def get_global_count(self, user_id: str) -> int:
+        return int(self._redis.get(self._user_key(user_id, "global")) or 0)
+
+    def get_thread_count(self, user_id: str) -> int:
+        """How many distinct threads has this user had detections in?"""
+        return self._redis.scard(self._user_key(user_id, "threads"))
+
+    def lookup(self, user_id: str, thread_id: str) -> tuple[UserThreadHistory, int, int]:
+        """The thread history, global count and thread count, in one round trip."""
+        key = self._thread_key(user_id, thread_id)
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hgetall(key)
+        pipe.smembers(f"{key}:types")
+        pipe.get(self._user_key(user_id, "global"))
+        pipe.scard(self._user_key(user_id, "threads"))
+        try:
+            fields, types_seen, global_count, thread_count = pipe.execute()
+        except self._redis_error as exc:
+            logger.warning("Behavioral store unavailable, scoring without history: %s", exc)
+            return UserThreadHistory(), 0, 0
+        return _history(fields, types_seen), int(global_count or 0), thread_count
+
+    def close(self) -> None:
+        """Close the client's connection pool."""
+        self._redis.close()
+
+
+def _history(fields: dict[str, str], types_seen: set[str]) -> UserThreadHistory:
+    """A UserThreadHistory from its Redis hash fields and types set."""
+    return UserThreadHistory(
+        detection_count=int(fields.get("detection_count", 0)),
+        last_detection_ts=float(fields.get("last_detection_ts", 0.0)),
+        types_seen=set(types_seen),
+        message_count=int(fields.get("message_count", 0)),
+    )
+
+
+def make_behavioral_context() -> BehavioralContext | RedisBehavioralContext:
+    """Build the behavioral store selected by ``settings.BEHAVIORAL_BACKEND``."""
+    if settings.BEHAVIORAL_BACKEND == "redis":
+        return RedisBehavioralContext()
+    return BehavioralContext()
 
 
 def run_stage3(
     text: str,
     user_id: str,
     thread_id: str,
-    context: BehavioralContext,
+    context: BehavioralContext | RedisBehavioralContext,
 ) -> StageResult:
     """Run behavioral analysis looking for repetition and escalation patterns.
 
@@ -78,9 +220,7 @@ def run_stage3(
     evidence: list[EvidenceSpan] = []
     score = 0.0
 
-    history = context.get_history(user_id, thread_id)
-    global_count = context.get_global_count(user_id)
-    thread_count = context.get_thread_count(user_id)
+    history, global_count, thread_count = context.lookup(user_id, thread_id)
 
     # Signal 1: Repeated attempts in same thread
     if history.detection_count >= 3:
@@ -3,18 +3,31 @@
 from __future__ import annotations
 
 import time
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
 from .api.routes import router
 from .config import settings
+from .engine.pipeline import DetectionPipeline
 
 _start_time = time.time()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Built per worker at startup rather than at import, so each uvicorn worker
+    # opens its own behavioral store connections after forking.
+    app.state.pipeline = DetectionPipeline()
+    yield
+    app.state.pipeline.close()
+
+
 app = FastAPI(
     title="CIS Detection Service",
     version="1.0.0",
     description="Contact Integrity System — NLP + rules detection engine",
+    lifespan=lifespan,
 )
 
 app.include_router(router)
@@ -65,7 +65,12 @@ class BatchAnalyzeResponse(BaseModel):
 
 
 class StageResult(BaseModel):
-    """Internal result from a single detection stage."""
+    """Internal result from a single detection stage.
+
+    Build this (and EvidenceSpan) with the normal constructor, not
+    ``model_construct``: validation runs in pydantic-core, while
+    ``model_construct`` runs in Python and benchmarks slower here.
+    """
     stage: int
     score: float = Field(ge=0.0, le=1.0)
     labels: list[str] = Field(default_factory=list)
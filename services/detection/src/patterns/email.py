@@ -8,11 +8,20 @@ high precision and recall.
 
 import re
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 import unicodedata
 
+# Prefer RE2 (linear-time, no backtracking) for the address patterns: the
+# obfuscation-tolerant ones chain optional whitespace quantifiers and take
+# seconds in the stdlib engine on a long run of spaces. Falls back to re if
+# the optional dependency isn't installed.
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
 
-@dataclass
+
+@dataclass(slots=True)
 class PatternMatch:
     """Represents a detected pattern match in text."""
     offset: int
@@ -30,6 +39,51 @@ EMAIL_INDICATORS = [
     r'\breach\s+(?:me\s+)?(?:via|by)\s+(?:email|mail)\b',
 ]
 
+# Common homoglyphs, as a str.translate table
+_HOMOGLYPH_TABLE = str.maketrans({
+    '\u0430': 'a',  # Cyrillic a
+    '\u0435': 'e',  # Cyrillic e
+    '\u043e': 'o',  # Cyrillic o
+    '\u0440': 'p',  # Cyrillic p
+    '\u0441': 'c',  # Cyrillic c
+    '\u0445': 'x',  # Cyrillic x
+    '\u0455': 's',  # Cyrillic s
+    '\u0456': 'i',  # Cyrillic i
+    '\u0458': 'j',  # Cyrillic j
+    '\u04bb': 'h',  # Cyrillic h
+})
+
+# Maps text 1:1 (offsets are preserved) so the address patterns can be
+# case-sensitive and see the same characters under RE2 and stdlib re: the
+# four non-ASCII letters case-insensitive matching would equate with
+# [a-zA-Z] become that letter, and whitespace RE2's ASCII-only \s misses
+# becomes a space. RE2 only accepts valid UTF-8, so lone surrogates are
+# replaced too.
+_SCAN_TABLE = str.maketrans({
+    **{chr(c): ' ' for c in range(0x3001) if chr(c).isspace() and chr(c) not in '\t\n\f\r '},
+    **{chr(c): '\ufffd' for c in range(0xD800, 0xE000)},
+    '\u0131': 'i',  # dotless i
+    '\u0130': 'I',  # I with dot above
+    '\u017f': 's',  # long s
+    '\u212a': 'K',  # Kelvin sign
+})
+
+# The ASCII characters _SCAN_TABLE changes
+_ASCII_SCAN_CHARS = re.compile(r'[\v\x1c-\x1f]')
+
+# RE2's \b is ASCII-only: it sees a boundary between an ASCII letter and a
+# non-ASCII one where stdlib re doesn't. The address classes are ASCII, so
+# no match can include a non-ASCII letter, nor start after one in the same
+# word; a match ending in \b can't end before one in the same word either.
+# Blanking those parts of words leaves RE2 with the matches stdlib re finds
+# (see EmailDetector._finditer()).
+_NON_ASCII_WORD_TAIL = re.compile(r'[^\W\x00-\x7f]\w*+')
+_NON_ASCII_WORD = re.compile(r'\b[0-9A-Za-z_]*+[^\W\x00-\x7f]\w*+')
+
+
+def _blank(match: re.Match) -> str:
+    return '\ufffd' * (match.end() - match.start())
+
 
 class EmailDetector:
     """Detects email addresses in various formats and obfuscations."""
@@ -40,71 +94,76 @@ class EmailDetector:
     def _compile_patterns(self):
         """Compile all regex patterns for email detection."""
 
+        # Patterns are case-sensitive: letter classes spell out both cases and
+        # run over _scan_text(), so the engine never has to case-fold.
+
         # Standard email format: user@domain.com
         # More permissive to catch edge cases
-        self.standard_pattern = re.compile(
+        self.standard_pattern = _regex.compile(
             r'\b[a-zA-Z0-9]'  # Start with alphanumeric
             r'[a-zA-Z0-9._+\-]*'  # Middle can have special chars
             r'@'
             r'[a-zA-Z0-9]'  # Domain starts with alphanumeric
             r'[a-zA-Z0-9.\-]*'  # Domain can have dots and hyphens
             r'\.'  # Must have at least one dot
-            r'[a-zA-Z]{2,}',  # TLD at least 2 chars
-            re.IGNORECASE
+            r'[a-zA-Z]{2,}'  # TLD at least 2 chars
         )
 
         # Spaced out format: "user at domain dot com"
-        self.spaced_pattern = re.compile(
+        self.spaced_pattern = _regex.compile(
             r'\b[a-zA-Z0-9]'
             r'[a-zA-Z0-9._+\-]*'
-            r'\s+(?:at|@)\s+'
+            r'\s+(?:[Aa][Tt]|@)\s+'
             r'[a-zA-Z0-9]'
             r'[a-zA-Z0-9.\-\s]*'
-            r'\s+dot\s+'
-            r'[a-zA-Z]{2,}\b',
-            re.IGNORECASE
+            r'\s+[Dd][Oo][Tt]\s+'
+            r'[a-zA-Z]{2,}\b'
         )
 
         # Obfuscated brackets: "user [at] domain [dot] com"
-        self.bracket_pattern = re.compile(
+        self.bracket_pattern = _regex.compile(
             r'\b[a-zA-Z0-9]'
             r'[a-zA-Z0-9._+\-]*'
-            r'\s*[\[\(]?\s*(?:at|@)\s*[\]\)]?\s*'
+            r'\s*[\[\(]?\s*(?:[Aa][Tt]|@)\s*[\]\)]?\s*'
             r'[a-zA-Z0-9]'
             r'[a-zA-Z0-9.\-\s]*'
-            r'\s*[\[\(]?\s*dot\s*[\]\)]?\s*'
-            r'[a-zA-Z]{2,}\b',
-            re.IGNORECASE
+            r'\s*[\[\(]?\s*[Dd][Oo][Tt]\s*[\]\)]?\s*'
+            r'[a-zA-Z]{2,}\b'
         )
 
         # Alternative separators: "user (at) domain (dot) com"
-        self.alt_separator_pattern = re.compile(
+        self.alt_separator_pattern = _regex.compile(
             r'\b[a-zA-Z0-9]'
             r'[a-zA-Z0-9._+\-]*'
             r'[\s\(\[\{]*'
-            r'(?:at|@|AT|\(at\)|\[at\])'
+            r'(?:[Aa][Tt]|@|\([Aa][Tt]\)|\[[Aa][Tt]\])'
             r'[\s\)\]\}]*'
             r'[a-zA-Z0-9]'
             r'[a-zA-Z0-9.\-\s]*'
             r'[\s\(\[\{]*'
-            r'(?:dot|DOT|\(dot\)|\[dot\]|\.)'
+            r'(?:[Dd][Oo][Tt]|\([Dd][Oo][Tt]\)|\[[Dd][Oo][Tt]\]|\.)'
             r'[\s\)\]\}]*'
-            r'[a-zA-Z]{2,}\b',
-            re.IGNORECASE
+            r'[a-zA-Z]{2,}\b'
         )
 
         # Domain with "dot" spelled out: user@domain dot com
-        self.mixed_dot_pattern = re.compile(
+        self.mixed_dot_pattern = _regex.compile(
             r'\b[a-zA-Z0-9]'
             r'[a-zA-Z0-9._+\-]*'
             r'@'
             r'[a-zA-Z0-9]'
             r'[a-zA-Z0-9.\-]*'
-            r'(?:\s+dot\s+|\s*\.\s*)'
-            r'[a-zA-Z]{2,}\b',
-            re.IGNORECASE
+            r'(?:\s+[Dd][Oo][Tt]\s+|\s*\.\s*)'
+            r'[a-zA-Z]{2,}\b'
         )
 
+        # Obfuscated separator normalization
+        self.at_word_pattern = re.compile(r'\s*[\[\(]?\s*(?:at)\s*[\]\)]?\s*')
+        self.dot_word_pattern = re.compile(r'\s*[\[\(]?\s*(?:dot)\s*[\]\)]?\s*')
+        self.spaced_dot_pattern = re.compile(r'\s*dot\s*')
+        self.bracket_chars_pattern = re.compile(r'[\[\]\(\)]')
+        self.whitespace_pattern = re.compile(r'\s+')
+
         # Context patterns for confidence boosting
         self.context_patterns = [
             re.compile(pattern, re.IGNORECASE)
@@ -112,65 +171,80 @@ class EmailDetector:
         ]
 
         # Common TLDs for validation
-        self.common_tlds = {
+        self.common_tlds = frozenset({
             'com', 'org', 'net', 'edu', 'gov', 'mil', 'int',
             'co', 'io', 'ai', 'app', 'dev', 'tech', 'info',
             'biz', 'name', 'pro', 'mobi', 'tel', 'travel',
             'uk', 'us', 'ca', 'au', 'de', 'fr', 'jp', 'cn',
             'ru', 'br', 'in', 'it', 'es', 'nl', 'se', 'no'
-        }
+        })
 
     def _normalize_unicode(self, text: str) -> str:
         """Normalize unicode characters to catch unicode tricks."""
-        # Normalize to NFKC (compatibility composition)
-        normalized = unicodedata.normalize('NFKC', text)
-
-        # Replace common homoglyphs
-        homoglyphs = {
-            '\u0430': 'a',  # Cyrillic a
-            '\u0435': 'e',  # Cyrillic e
-            '\u043e': 'o',  # Cyrillic o
-            '\u0440': 'p',  # Cyrillic p
-            '\u0441': 'c',  # Cyrillic c
-            '\u0445': 'x',  # Cyrillic x
-            '\u0455': 's',  # Cyrillic s
-            '\u0456': 'i',  # Cyrillic i
-            '\u0458': 'j',  # Cyrillic j
-            '\u04bb': 'h',  # Cyrillic h
-        }
-
-        for original, replacement in homoglyphs.items():
-            normalized = normalized.replace(original, replacement)
-
-        return normalized
+        # ASCII is already NFKC-normal and contains no homoglyphs
+        if text.isascii():
+            return text
+
+        # Normalize to NFKC (compatibility composition), then replace
+        # common homoglyphs
+        return unicodedata.normalize('NFKC', text).translate(_HOMOGLYPH_TABLE)
+
+    def _scan_text(self, text: str) -> str:
+        """Text to run the address patterns over (same length as ``text``).
+
+        detect() builds this once and passes it to the obfuscated-format
+        detectors, which build it themselves otherwise.
+        """
+        if text.isascii() and (_regex is re or not _ASCII_SCAN_CHARS.search(text)):
+            return text
+        return text.translate(_SCAN_TABLE)
+
+    def _finditer(self, pattern, scan_text: str, trailing_boundary: bool = True):
+        """Matches of ``pattern`` in ``scan_text``, as stdlib re finds them.
+
+        RE2 runs over ASCII bytes, so its wrapper has no offsets to convert:
+        other characters become '?', which none of the patterns match either.
+        Its \\b then only goes wrong next to a non-ASCII letter, so matches
+        are checked there, and only if one fails is the search redone over
+        the blanked text. ``trailing_boundary`` is whether the pattern ends
+        in \\b; only the standard pattern doesn't.
+        """
+        if _regex is re:
+            return pattern.finditer(scan_text)
+        if scan_text.isascii():
+            return pattern.finditer(scan_text.encode('ascii'))
+        matches = []
+        for match in pattern.finditer(scan_text.encode('ascii', 'replace')):
+            start, end = match.span()
+            if (start and scan_text[start - 1].isalnum()) or (
+                    trailing_boundary and end < len(scan_text) and scan_text[end].isalnum()):
+                words = _NON_ASCII_WORD if trailing_boundary else _NON_ASCII_WORD_TAIL
+                blanked = words.sub(_blank, scan_text)
+                return pattern.finditer(blanked.encode('ascii', 'replace'))
+            matches.append(match)
+        return matches
 
     def _has_email_context(self, text: str, match_pos: int, window: int = 30) -> bool:
         """Check if there's email-related context near the match."""
         start = max(0, match_pos - window)
         end = min(len(text), match_pos + window)
-        context = text[start:end]
 
+        # Search the window in place rather than slicing it out
         for pattern in self.context_patterns:
-            if pattern.search(context):
+            if pattern.search(text, start, end):
                 return True
         return False
 
     def _extract_tld(self, email: str) -> str:
-        """Extract TLD from email address."""
+        """Extract TLD from an email already lowercased by _normalize_email."""
         # Normalize spaces and obfuscation
-        email = email.lower()
-        email = re.sub(r'\s*dot\s*', '.', email)
-        email = re.sub(r'[\[\]\(\)]', '', email)
+        email = self.bracket_chars_pattern.sub('', self.spaced_dot_pattern.sub('.', email))
 
         # Get last part after final dot
-        parts = email.split('.')
-        if parts:
-            return parts[-1].strip()
-        return ''
+        return email.rpartition('.')[2].strip()
 
     def _is_valid_tld(self, tld: str) -> bool:
-        """Check if TLD is valid."""
-        tld = tld.lower().strip()
+        """Check if TLD is valid (as returned by _extract_tld)."""
         # Check common TLDs or if it's at least 2 chars alpha
         return tld in self.common_tlds or (len(tld) >= 2 and tld.isalpha())
 
@@ -179,13 +253,13 @@ class EmailDetector:
         normalized = text.lower()
 
         # Replace "at" with @
-        normalized = re.sub(r'\s*[\[\(]?\s*(?:at)\s*[\]\)]?\s*', '@', normalized)
+        normalized = self.at_word_pattern.sub('@', normalized)
 
         # Replace "dot" with .
-        normalized = re.sub(r'\s*[\[\(]?\s*(?:dot)\s*[\]\)]?\s*', '.', normalized)
+        normalized = self.dot_word_pattern.sub('.', normalized)
 
         # Remove extra spaces
-        normalized = re.sub(r'\s+', '', normalized)
+        normalized = self.whitespace_pattern.sub('', normalized)
 
         return normalized
 
@@ -194,9 +268,15 @@ class EmailDetector:
         """Calculate confidence score for an email match."""
         confidence = 0.5  # Base confidence
 
-        # Normalize to check TLD
-        normalized = self._normalize_email(match_text)
-        tld = self._extract_tld(normalized)
+        # Normalize to check TLD. A standard match has no spelled-out or
+        # bracketed separators to undo; running the word substitutions on it
+        # would only mangle addresses like "kate@..." into "k@e@...".
+        if pattern_type == 'standard':
+            normalized = match_text.lower()
+            tld = normalized.rpartition('.')[2]
+        else:
+            normalized = self._normalize_email(match_text)
+            tld = self._extract_tld(normalized)
 
         # Boost for valid TLD
         if self._is_valid_tld(tld):
@@ -218,8 +298,8 @@ class EmailDetector:
             confidence += 0.15
 
         # Penalize very short local parts (before @)
-        local_part = normalized.split('@')[0] if '@' in normalized else ''
-        if len(local_part) < 2:
+        local_part, at, _ = normalized.partition('@')
+        if not at or len(local_part) < 2:
             confidence -= 0.2
 
         # Penalize suspicious patterns
@@ -232,34 +312,84 @@ class EmailDetector:
 
         return max(0.0, min(1.0, confidence))
 
+    def _original_spans(self, text: str, normalized: str):
+        """Map each character of ``_normalize_unicode(text)`` back to ``text``.
+
+        NFKC can change the length of the text (ligatures, compatibility
+        forms), which shifts match offsets. Normalizes each base character
+        with its combining marks separately and records the original span
+        every output character came from. Returns ``(starts, ends)`` lists
+        indexed by normalized position, or None if the piecewise result
+        differs from whole-text normalization.
+        """
+        starts: List[int] = []
+        ends: List[int] = []
+        pieces = []
+        i = 0
+        while i < len(text):
+            j = i + 1
+            while j < len(text) and unicodedata.combining(text[j]):
+                j += 1
+            piece = self._normalize_unicode(text[i:j])
+            pieces.append(piece)
+            starts.extend([i] * len(piece))
+            ends.extend([j] * len(piece))
+            i = j
+        if ''.join(pieces) != normalized:
+            return None
+        return starts, ends
+
     def detect_standard(self, text: str) -> List[PatternMatch]:
-        """Detect standard format email addresses."""
+        """Detect standard format email addresses.
+
+        Matching runs on unicode-normalized text; offsets refer to the
+        original text and values are the normalized address.
+        """
         # Normalize unicode first
         normalized_text = self._normalize_unicode(text)
 
+        # Literal prefilter: the pattern requires an '@'
+        if '@' not in normalized_text:
+            return []
+
+        # Offsets only need mapping back when normalization changed the length
+        spans = None
+        if len(normalized_text) != len(text):
+            spans = self._original_spans(text, normalized_text)
+
         matches = []
-        for match in self.standard_pattern.finditer(normalized_text):
-            matched_text = match.group(0)
+        scan_text = self._scan_text(normalized_text)
+        for match in self._finditer(self.standard_pattern, scan_text, trailing_boundary=False):
+            matched_text = normalized_text[match.start():match.end()]
 
             confidence = self._calculate_confidence(
                 matched_text, normalized_text, match.start(), 'standard'
             )
 
             if confidence > 0.3:  # Threshold to filter false positives
+                start, end = match.span()
+                if spans is not None:
+                    start, end = spans[0][start], spans[1][end - 1]
                 matches.append(PatternMatch(
-                    offset=match.start(),
-                    length=len(matched_text),
+                    offset=start,
+                    length=end - start,
                     type='email',
                     confidence=confidence,
                     value=matched_text
                 ))
         return matches
 
-    def detect_spaced(self, text: str) -> List[PatternMatch]:
+    def detect_spaced(self, text: str,
+                      scan_text: Optional[str] = None) -> List[PatternMatch]:
         """Detect spaced-out email addresses."""
+        if 'dot' not in text.lower():
+            return []
+
         matches = []
-        for match in self.spaced_pattern.finditer(text):
-            matched_text = match.group(0)
+        if scan_text is None:
+            scan_text = self._scan_text(text)
+        for match in self._finditer(self.spaced_pattern, scan_text):
+            matched_text = text[match.start():match.end()]
 
             confidence = self._calculate_confidence(
                 matched_text, text, match.start(), 'spaced'
@@ -276,11 +406,17 @@ class EmailDetector:
                 ))
         return matches
 
-    def detect_bracket_obfuscation(self, text: str) -> List[PatternMatch]:
+    def detect_bracket_obfuscation(self, text: str,
+                                   scan_text: Optional[str] = None) -> List[PatternMatch]:
         """Detect bracket-obfuscated email addresses."""
+        if 'dot' not in text.lower():
+            return []
+
         matches = []
-        for match in self.bracket_pattern.finditer(text):
-            matched_text = match.group(0)
+        if scan_text is None:
+            scan_text = self._scan_text(text)
+        for match in self._finditer(self.bracket_pattern, scan_text):
+            matched_text = text[match.start():match.end()]
 
             confidence = self._calculate_confidence(
                 matched_text, text, match.start(), 'bracket'
@@ -296,11 +432,17 @@ class EmailDetector:
                 ))
         return matches
 
-    def detect_alt_separator(self, text: str) -> List[PatternMatch]:
+    def detect_alt_separator(self, text: str,
+                             scan_text: Optional[str] = None) -> List[PatternMatch]:
         """Detect alternative separator email addresses."""
+        if '.' not in text and 'dot' not in text.lower():
+            return []
+
         matches = []
-        for match in self.alt_separator_pattern.finditer(text):
-            matched_text = match.group(0)
+        if scan_text is None:
+            scan_text = self._scan_text(text)
+        for match in self._finditer(self.alt_separator_pattern, scan_text):
+            matched_text = text[match.start():match.end()]
 
             confidence = self._calculate_confidence(
                 matched_text, text, match.start(), 'alt_separator'
@@ -316,11 +458,17 @@ class EmailDetector:
                 ))
         return matches
 
-    def detect_mixed_dot(self, text: str) -> List[PatternMatch]:
+    def detect_mixed_dot(self, text: str,
+                         scan_text: Optional[str] = None) -> List[PatternMatch]:
         """Detect emails with mixed dot notation."""
+        if '@' not in text:
+            return []
+
         matches = []
-        for match in self.mixed_dot_pattern.finditer(text):
-            matched_text = match.group(0)
+        if scan_text is None:
+            scan_text = self._scan_text(text)
+        for match in self._finditer(self.mixed_dot_pattern, scan_text):
+            matched_text = text[match.start():match.end()]
 
             confidence = self._calculate_confidence(
                 matched_text, text, match.start(), 'mixed'
@@ -337,6 +485,10 @@ class EmailDetector:
         return matches
 
 
+# Patterns are compiled once; the detector holds no per-call state
+_DETECTOR = EmailDetector()
+
+
 def _deduplicate_matches(matches: List[PatternMatch]) -> List[PatternMatch]:
     """Remove overlapping matches, keeping highest confidence."""
     if not matches:
@@ -345,21 +497,16 @@ def _deduplicate_matches(matches: List[PatternMatch]) -> List[PatternMatch]:
     # Sort by position, then by confidence descending
     sorted_matches = sorted(matches, key=lambda m: (m.offset, -m.confidence))
 
+    # Accepted matches never overlap and arrive in offset order, so a
+    # candidate only has to clear the end of the last accepted match
     result = []
+    last_end = -1
     for match in sorted_matches:
-        # Check if this match overlaps with any accepted match
-        overlaps = False
-        for accepted in result:
-            # Check for overlap
-            if not (match.offset >= accepted.offset + accepted.length or
-                    match.offset + match.length <= accepted.offset):
-                overlaps = True
-                break
-
-        if not overlaps:
+        if match.offset >= last_end:
             result.append(match)
+            last_end = match.offset + match.length
 
-    return sorted(result, key=lambda m: m.offset)
+    return result
 
 
 def detect(text: str) -> List[PatternMatch]:
@@ -373,13 +520,16 @@ def detect(text: str) -> List[PatternMatch]:
         List of PatternMatch objects for detected emails,
         deduplicated and sorted by offset
     """
-    detector = EmailDetector()
+    detector = _DETECTOR
+
+    # The obfuscated formats share one scan text
+    scan_text = detector._scan_text(text)
 
     all_matches = []
     all_matches.extend(detector.detect_standard(text))
-    all_matches.extend(detector.detect_spaced(text))
-    all_matches.extend(detector.detect_bracket_obfuscation(text))
-    all_matches.extend(detector.detect_alt_separator(text))
-    all_matches.extend(detector.detect_mixed_dot(text))
+    all_matches.extend(detector.detect_spaced(text, scan_text))
+    all_matches.extend(detector.detect_bracket_obfuscation(text, scan_text))
+    all_matches.extend(detector.detect_alt_separator(text, scan_text))
+    all_matches.extend(detector.detect_mixed_dot(text, scan_text))
 
     return _deduplicate_matches(all_matches)
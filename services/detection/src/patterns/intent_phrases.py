@@ -8,10 +8,17 @@ high precision and recall.
 
 import re
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Optional
 
+# Optional RE2 engine (pip install .[re2]) for the category prefilters. Falls
+# back to re if the optional dependency isn't installed.
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
 
-@dataclass
+
+@dataclass(slots=True)
 class PatternMatch:
     """Represents a detected pattern match in text."""
     offset: int
@@ -145,6 +152,22 @@ CONTEXT_BOOSTERS = {
     ],
 }
 
+# Contact types that boost confidence when two or more appear near a match
+CONTACT_TYPE_TERMS = (
+    'number', 'phone', 'email', 'whatsapp', 'telegram',
+    'instagram', 'snapchat', 'discord', 'signal',
+)
+
+# Explicit platform evasion language
+EVASION_TERMS = (
+    'off platform', 'outside of here', 'not here',
+    'bypass', 'without using this',
+)
+
+# Python's \s also matches \v and \x1c-\x1f, RE2's doesn't: map them to a
+# plain space before an RE2 scan (they are non-word characters either way)
+_RE2_SPACE_TABLE = str.maketrans({c: ' ' for c in '\v\x1c\x1d\x1e\x1f'})
+
 
 class IntentDetector:
     """Detects phrases indicating intent to share contact information."""
@@ -156,15 +179,45 @@ class IntentDetector:
         """Compile all regex patterns for intent detection."""
         self.category_patterns: Dict[str, Dict] = {}
 
+        # Pattern sources are all lowercase. Besides the IGNORECASE versions,
+        # each is also compiled case-sensitively ('lower_*') for scanning
+        # lowercased ASCII text, which skips case folding in the matcher.
         for category, config in INTENT_CATEGORIES.items():
+            any_pattern = '|'.join(f'(?:{pattern})' for pattern in config['patterns'])
             self.category_patterns[category] = {
                 'patterns': [
                     re.compile(pattern, re.IGNORECASE)
                     for pattern in config['patterns']
                 ],
+                'lower_patterns': [re.compile(pattern) for pattern in config['patterns']],
+                # Matches somewhere iff one of the category's patterns does
+                'any_pattern': re.compile(any_pattern, re.IGNORECASE),
+                'lower_any_pattern': re.compile(any_pattern),
                 'confidence_boost': config['confidence_boost'],
             }
 
+        # One alternation over every category pattern: if it finds nothing,
+        # no individual pattern can match and the per-pattern scans are skipped
+        any_intent = '|'.join(
+            f'(?:{pattern})'
+            for config in INTENT_CATEGORIES.values()
+            for pattern in config['patterns']
+        )
+        self.any_intent_pattern = re.compile(any_intent, re.IGNORECASE)
+        self.lower_any_intent_pattern = re.compile(any_intent)
+
+        # With RE2, one DFA pass reports every category that matches anywhere
+        # (an RE2::Set, indexed like category_names). Its \b and case folding
+        # are ASCII-only, so it is used for ASCII text only.
+        self.category_names = list(INTENT_CATEGORIES)
+        self.category_set = None
+        if _regex is not re:
+            self.category_set = _regex.Set.SearchSet()
+            for category in self.category_names:
+                any_pattern = self.category_patterns[category]['any_pattern']
+                self.category_set.Add('(?i)' + any_pattern.pattern)
+            self.category_set.Compile()
+
         # Compile context booster patterns
         self.context_booster_patterns = {}
         for category, terms in CONTEXT_BOOSTERS.items():
@@ -173,15 +226,68 @@ class IntentDetector:
                 re.IGNORECASE
             )
 
+        # Sentence separators for compound intent
+        self.sentence_break_pattern = re.compile(r'[.!?]\s+')
+
+        # Negations that might invalidate a nearby match
+        self.negation_pattern = re.compile(
+            r'\b(?:don\'?t|doesn\'?t|won\'?t|wouldn\'?t|shouldn\'?t|never|not|no)\b',
+            re.IGNORECASE
+        )
+
+    def matching_categories(self, text: str) -> List[str]:
+        """Categories with at least one pattern matching somewhere in the text."""
+        if text.isascii():
+            if self.category_set is not None:
+                return self._set_categories(text.translate(_RE2_SPACE_TABLE))
+            text, prefix = text.lower(), 'lower_'
+            any_intent_pattern = self.lower_any_intent_pattern
+        else:
+            prefix = ''
+            any_intent_pattern = self.any_intent_pattern
+        # Most messages contain no intent phrase: rule them out in one scan
+        if not any_intent_pattern.search(text):
+            return []
+        return [
+            category for category, config in self.category_patterns.items()
+            if config[prefix + 'any_pattern'].search(text)
+        ]
+
+    @staticmethod
+    def _scan_form(text: str):
+        """Text to run the category patterns over, and their key prefix.
+
+        ASCII text is lowercased (same length, same offsets) and scanned with
+        the case-sensitive 'lower_' patterns. Other text keeps IGNORECASE, as
+        lowercasing can change its length and Unicode case folding differs.
+        """
+        if text.isascii():
+            return text.lower(), 'lower_'
+        return text, ''
+
+    def _set_categories(self, scan_text: str) -> List[str]:
+        """Run the RE2 category set over ASCII text prepared for RE2."""
+        hits = self.category_set.Match(scan_text) or ()
+        return [self.category_names[i] for i in sorted(hits)]
+
     def _check_context_boosters(self, text: str, match_pos: int, window: int = 50) -> float:
         """Check for context boosters near the match and return confidence adjustment."""
         start = max(0, match_pos - window)
         end = min(len(text), match_pos + window)
         context = text[start:end]
 
+        # Substring prefilter: a term can only match if it occurs in the
+        # lowercased window. Only exact for ASCII (IGNORECASE also folds e.g.
+        # dotless 'ı' to 'i'), so other windows go straight to the regex.
+        lowered = context.lower() if context.isascii() else None
+
         boost = 0.0
         for category, pattern in self.context_booster_patterns.items():
-            if pattern.search(context):
+            if lowered is not None and not any(
+                term in lowered for term in CONTEXT_BOOSTERS[category]
+            ):
+                continue
+            if pattern.search(text, start, end):
                 if category == 'contact_terms':
                     boost += 0.15
                 elif category == 'platform_terms':
@@ -194,17 +300,7 @@ class IntentDetector:
     def _has_negation_nearby(self, text: str, match_pos: int, window: int = 20) -> bool:
         """Check if there's negation near the match that might invalidate it."""
         start = max(0, match_pos - window)
-        context = text[start:match_pos]
-
-        negation_patterns = [
-            r'\bdon\'?t\b', r'\bdoesn\'?t\b', r'\bwon\'?t\b', r'\bwouldn\'?t\b',
-            r'\bshouldn\'?t\b', r'\bnever\b', r'\bnot\b', r'\bno\b'
-        ]
-
-        for pattern in negation_patterns:
-            if re.search(pattern, context, re.IGNORECASE):
-                return True
-        return False
+        return self.negation_pattern.search(text, start, match_pos) is not None
 
     def _calculate_confidence(self, match_text: str, full_text: str,
                              match_pos: int, category: str,
@@ -225,20 +321,21 @@ class IntentDetector:
             confidence -= 0.3
 
         # Boost for multiple contact types mentioned
-        contact_types = ['number', 'phone', 'email', 'whatsapp', 'telegram',
-                        'instagram', 'snapchat', 'discord', 'signal']
         window_start = max(0, match_pos - 50)
         window_end = min(len(full_text), match_pos + len(match_text) + 50)
         window = full_text[window_start:window_end].lower()
 
-        contact_count = sum(1 for term in contact_types if term in window)
+        contact_count = 0
+        for term in CONTACT_TYPE_TERMS:
+            if term in window:
+                contact_count += 1
+                if contact_count >= 2:
+                    break
         if contact_count >= 2:
             confidence += 0.1
 
         # Boost for explicit platform evasion language
-        evasion_terms = ['off platform', 'outside of here', 'not here',
-                        'bypass', 'without using this']
-        if any(term in window for term in evasion_terms):
+        if any(term in window for term in EVASION_TERMS):
             confidence += 0.15
 
         return max(0.0, min(1.0, confidence))
@@ -250,11 +347,23 @@ class IntentDetector:
         if category not in self.category_patterns:
             return matches
 
-        patterns = self.category_patterns[category]['patterns']
+        # One scan rules out the whole category; individual patterns are
+        # still run for their (possibly overlapping) matches
+        scan_text, prefix = self._scan_form(text)
+        if not self.category_patterns[category][prefix + 'any_pattern'].search(scan_text):
+            return matches
+
+        return self._scan_category(text, category)
+
+    def _scan_category(self, text: str, category: str) -> List[PatternMatch]:
+        """Collect every match of each of the category's patterns."""
+        matches = []
+        scan_text, prefix = self._scan_form(text)
+        patterns = self.category_patterns[category][prefix + 'patterns']
 
         for pattern in patterns:
-            for match in pattern.finditer(text):
-                matched_text = match.group(0)
+            for match in pattern.finditer(scan_text):
+                matched_text = text[match.start():match.end()]
 
                 # Base confidence depends on category
                 base_confidence = 0.5
@@ -275,29 +384,50 @@ class IntentDetector:
 
         return matches
 
-    def detect_compound_intent(self, text: str) -> List[PatternMatch]:
+    def detect_compound_intent(
+        self, text: str, categories: Optional[List[str]] = None
+    ) -> List[PatternMatch]:
         """
         Detect compound intent patterns where multiple signals appear together.
         This catches cases where individual phrases might be weak but together
         indicate strong intent.
+
+        ``categories`` is the result of ``matching_categories(text)`` when the
+        caller already has it; only those categories can occur in a sentence.
         """
         matches = []
 
-        # Look for sentences with multiple intent signals
-        sentences = re.split(r'[.!?]\s+', text)
-        offset = 0
+        if categories is None:
+            categories = self.matching_categories(text)
+        if len(categories) < 2:
+            return matches
 
-        for sentence in sentences:
-            intent_count = 0
-            categories_found = []
+        # Sentence spans, scanned in place rather than split into substrings
+        bounds = [0]
+        for separator in self.sentence_break_pattern.finditer(text):
+            bounds.extend(separator.span())
+        bounds.append(len(text))
 
+        # Sentences start after whitespace, so RE2 can scan them as slices
+        set_text = None
+        if self.category_set is not None and text.isascii():
+            set_text = text.translate(_RE2_SPACE_TABLE)
+        else:
+            scan_text, prefix = self._scan_form(text)
+
+        for offset, end in zip(bounds[::2], bounds[1::2]):
             # Check each category in this sentence
-            for category, config in self.category_patterns.items():
-                for pattern in config['patterns']:
-                    if pattern.search(sentence):
-                        intent_count += 1
-                        categories_found.append(category)
-                        break  # Count category once per sentence
+            if set_text is not None:
+                categories_found = self._set_categories(set_text[offset:end])
+            else:
+                categories_found = [
+                    category for category in categories
+                    if self.category_patterns[category][prefix + 'any_pattern'].search(
+                        scan_text, offset, end
+                    )
+                ]
+            # Each category is listed once, in INTENT_CATEGORIES order
+            intent_count = len(categories_found)
 
             # If multiple intent signals in one sentence, create a compound match
             if intent_count >= 2:
@@ -305,17 +435,19 @@ class IntentDetector:
 
                 matches.append(PatternMatch(
                     offset=offset,
-                    length=len(sentence),
+                    length=end - offset,
                     type='intent',
                     confidence=confidence,
-                    value=f"compound:{','.join(set(categories_found))}"
+                    value='compound:' + ','.join(categories_found)
                 ))
 
-            offset += len(sentence) + 1  # +1 for the separator
-
         return matches
 
 
+# Patterns are compiled once; the detector holds no per-call state
+_DETECTOR = IntentDetector()
+
+
 def _deduplicate_matches(matches: List[PatternMatch]) -> List[PatternMatch]:
     """Remove overlapping matches, keeping highest confidence."""
     if not matches:
@@ -324,21 +456,16 @@ def _deduplicate_matches(matches: List[PatternMatch]) -> List[PatternMatch]:
     # Sort by position, then by confidence descending
     sorted_matches = sorted(matches, key=lambda m: (m.offset, -m.confidence))
 
+    # Accepted matches never overlap and arrive in offset order, so a
+    # candidate only has to clear the end of the last accepted match
     result = []
+    last_end = -1
     for match in sorted_matches:
-        # Check if this match overlaps with any accepted match
-        overlaps = False
-        for accepted in result:
-            # Check for overlap
-            if not (match.offset >= accepted.offset + accepted.length or
-                    match.offset + match.length <= accepted.offset):
-                overlaps = True
-                break
-
-        if not overlaps:
+        if match.offset >= last_end:
             result.append(match)
+            last_end = match.offset + match.length
 
-    return sorted(result, key=lambda m: m.offset)
+    return result
 
 
 def detect(text: str) -> List[PatternMatch]:
@@ -352,15 +479,20 @@ def detect(text: str) -> List[PatternMatch]:
         List of PatternMatch objects for detected intent phrases,
         deduplicated and sorted by offset
     """
-    detector = IntentDetector()
+    detector = _DETECTOR
+
+    # Most messages contain no intent phrase at all
+    categories = detector.matching_categories(text)
+    if not categories:
+        return []
 
     all_matches = []
 
-    # Detect each category
-    for category in INTENT_CATEGORIES.keys():
-        all_matches.extend(detector.detect_category(text, category))
+    # Detect each category that matched
+    for category in categories:
+        all_matches.extend(detector._scan_category(text, category))
 
     # Detect compound intent patterns
-    all_matches.extend(detector.detect_compound_intent(text))
+    all_matches.extend(detector.detect_compound_intent(text, categories))
 
     return _deduplicate_matches(all_matches)
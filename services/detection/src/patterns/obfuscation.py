@@ -12,7 +12,7 @@ from dataclasses import dataclass
 from typing import List, Dict, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class PatternMatch:
     """Represents a detected pattern match in text."""
     offset: int
@@ -71,7 +71,6 @@ HOMOGLYPH_MAP = {
     '\u0421': 'C',  # С -> C
     '\u0422': 'T',  # Т -> T
     '\u0425': 'X',  # Х -> X
-    '\u0405': 'S',  # Ѕ -> S
 
     # Greek -> Latin
     '\u03b1': 'a',  # α -> a
@@ -132,6 +131,55 @@ LEET_SPEAK_MAP = {
     '<': 'c',
 }
 
+# str.translate tables: each normalization step is a single C-level pass
+_ZERO_WIDTH_TABLE = str.maketrans(dict.fromkeys(ZERO_WIDTH_CHARS))
+_HOMOGLYPH_TABLE = str.maketrans(HOMOGLYPH_MAP)
+_FULLWIDTH_TABLE = {
+    code: code - FULLWIDTH_OFFSET for code in range(FULLWIDTH_START, FULLWIDTH_END + 1)
+}
+_LEET_SPEAK_TABLE = str.maketrans(LEET_SPEAK_MAP)
+# Leet digits only: '@', '(', '[' etc. are left as they are
+_LEET_DIGIT_TABLE = str.maketrans({k: v for k, v in LEET_SPEAK_MAP.items() if k.isdigit()})
+# Deletes leet characters; the length difference counts them in one pass
+_LEET_DELETE_TABLE = str.maketrans(dict.fromkeys(LEET_SPEAK_MAP))
+
+
+class _MarkTable(dict):
+    """str.translate table mapping combining marks of the given categories.
+
+    Enumerating every code point's category up front costs ~200ms at import,
+    so entries are filled in the first time a code point is looked up.
+    Only BMP results are kept, which bounds the table at 64K entries;
+    astral characters (mostly emoji) are classified on each lookup.
+    """
+
+    def __init__(self, categories: frozenset, replacement):
+        super().__init__()
+        self.categories = categories
+        self.replacement = replacement
+
+    def __missing__(self, code: int):
+        if unicodedata.category(chr(code)) in self.categories:
+            value = self.replacement
+        else:
+            value = code
+        if code <= 0xFFFF:
+            self[code] = value
+        return value
+
+
+# Deletes nonspacing marks (what NFD + dropping category Mn strips)
+_NONSPACING_MARK_TABLE = _MarkTable(frozenset({'Mn'}), None)
+
+# Maps every combining mark (Mn, Mc, Me) to U+0300, itself a mark, so runs
+# of marks can be found with a regex; the mapping is 1:1, offsets are kept
+_COMBINING_MARK = '\u0300'
+_COMBINING_MARK_TABLE = _MarkTable(frozenset({'Mn', 'Mc', 'Me'}), ord(_COMBINING_MARK))
+
+# Zero-width, homoglyph and fullwidth mappings have disjoint keys and ASCII
+# (or empty) outputs, so they can be applied together in one pass
+_UNICODE_TABLE = {**_ZERO_WIDTH_TABLE, **_HOMOGLYPH_TABLE, **_FULLWIDTH_TABLE}
+
 
 class ObfuscationDetector:
     """Detects and normalizes text obfuscation techniques."""
@@ -146,62 +194,67 @@ class ObfuscationDetector:
         zero_width_chars = ''.join(ZERO_WIDTH_CHARS.keys())
         self.zero_width_pattern = re.compile(f'[{re.escape(zero_width_chars)}]+')
 
+        # Pattern for detecting homoglyph runs: a homoglyph followed by any
+        # word characters (\w is exactly str.isalnum() plus '_'), dots,
+        # hyphens or '@'
+        homoglyphs = ''.join(HOMOGLYPH_MAP.keys())
+        self.homoglyph_pattern = re.compile(rf'[{re.escape(homoglyphs)}][\w.\-@]*')
+
         # Pattern for detecting fullwidth characters
         self.fullwidth_pattern = re.compile(
             f'[{chr(FULLWIDTH_START)}-{chr(FULLWIDTH_END)}]+'
         )
 
-        # Pattern for detecting combining diacritical marks
+        # Pattern for detecting runs of two or more combining marks, over
+        # text mapped with _COMBINING_MARK_TABLE
         # Unicode categories: Mn (Nonspacing Mark), Mc (Spacing Mark), Me (Enclosing Mark)
-        self.combining_marks_pattern = re.compile(r'[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff]+')
+        self.combining_marks_pattern = re.compile(f'{_COMBINING_MARK}{{2,}}')
 
         # Pattern for detecting excessive leet speak
         self.leet_pattern = re.compile(r'\b\w*[0-9@$!|()[\]<>]{2,}\w*\b')
 
         # Pattern for mixed script detection (Latin + Cyrillic/Greek)
-        self.cyrillic_in_latin = re.compile(r'[a-zA-Z]+[\u0400-\u04ff]+[a-zA-Z]*|[\u0400-\u04ff]+[a-zA-Z]+')
-        self.greek_in_latin = re.compile(r'[a-zA-Z]+[\u0370-\u03ff]+[a-zA-Z]*|[\u0370-\u03ff]+[a-zA-Z]+')
+        # Runs only start at the beginning of a script run and never give
+        # characters back (the scripts are disjoint): a match can't start
+        # inside a run where one from its beginning failed, and retrying
+        # every suffix of a long run is quadratic
+        self.cyrillic_in_latin = re.compile(
+            r'(?<![a-zA-Z])[a-zA-Z]++[\u0400-\u04ff]++[a-zA-Z]*'
+            r'|(?<![\u0400-\u04ff])[\u0400-\u04ff]++[a-zA-Z]+'
+        )
+        self.greek_in_latin = re.compile(
+            r'(?<![a-zA-Z])[a-zA-Z]++[\u0370-\u03ff]++[a-zA-Z]*'
+            r'|(?<![\u0370-\u03ff])[\u0370-\u03ff]++[a-zA-Z]+'
+        )
+        # Either script must occur at all for its mixed pattern to match
+        self.cyrillic_char_pattern = re.compile(r'[\u0400-\u04ff]')
+        self.greek_char_pattern = re.compile(r'[\u0370-\u03ff]')
+
+        # Pattern: single char followed by space, repeated
+        self.unusual_spacing_pattern = re.compile(r'\b(?:\w\s){3,}\w\b')
 
     def remove_zero_width_chars(self, text: str) -> str:
         """Remove zero-width and invisible characters."""
-        for char in ZERO_WIDTH_CHARS.keys():
-            text = text.replace(char, '')
-        return text
+        return text.translate(_ZERO_WIDTH_TABLE)
 
     def normalize_homoglyphs(self, text: str) -> str:
         """Replace homoglyphs with their Latin equivalents."""
-        for original, replacement in HOMOGLYPH_MAP.items():
-            text = text.replace(original, replacement)
-        return text
+        return text.translate(_HOMOGLYPH_TABLE)
 
     def normalize_fullwidth(self, text: str) -> str:
         """Convert fullwidth characters to normal ASCII."""
-        result = []
-        for char in text:
-            code = ord(char)
-            if FULLWIDTH_START <= code <= FULLWIDTH_END:
-                # Convert to normal ASCII
-                result.append(chr(code - FULLWIDTH_OFFSET))
-            else:
-                result.append(char)
-        return ''.join(result)
+        return text.translate(_FULLWIDTH_TABLE)
 
     def remove_combining_marks(self, text: str) -> str:
         """Remove combining diacritical marks."""
         # Normalize to NFD (decomposed form)
         nfd = unicodedata.normalize('NFD', text)
         # Remove combining marks
-        return ''.join(char for char in nfd if unicodedata.category(char) != 'Mn')
+        return nfd.translate(_NONSPACING_MARK_TABLE)
 
     def normalize_leet_speak(self, text: str) -> str:
         """Normalize leet speak substitutions."""
-        result = []
-        for char in text:
-            if char in LEET_SPEAK_MAP:
-                result.append(LEET_SPEAK_MAP[char])
-            else:
-                result.append(char)
-        return ''.join(result)
+        return text.translate(_LEET_SPEAK_TABLE)
 
     def detect_zero_width_chars(self, text: str) -> List[PatternMatch]:
         """Detect zero-width character sequences."""
@@ -222,41 +275,28 @@ class ObfuscationDetector:
     def detect_homoglyphs(self, text: str) -> List[PatternMatch]:
         """Detect homoglyph usage."""
         matches = []
-
-        # Check for homoglyphs character by character
-        i = 0
-        while i < len(text):
-            if text[i] in HOMOGLYPH_MAP:
-                # Found a homoglyph, extend to find consecutive homoglyphs
-                start = i
-                while i < len(text) and (
-                    text[i] in HOMOGLYPH_MAP or
-                    text[i].isalnum() or
-                    text[i] in '._-@'
-                ):
-                    i += 1
-
-                matched_text = text[start:i]
-                # Only report if there's actual obfuscation (contains homoglyph)
-                if any(c in HOMOGLYPH_MAP for c in matched_text):
-                    matches.append(PatternMatch(
-                        offset=start,
-                        length=len(matched_text),
-                        type='obfuscation',
-                        confidence=0.85,
-                        value=f"homoglyph:{matched_text}"
-                    ))
-            else:
-                i += 1
-
+        for match in self.homoglyph_pattern.finditer(text):
+            matched_text = match.group(0)
+            matches.append(PatternMatch(
+                offset=match.start(),
+                length=len(matched_text),
+                type='obfuscation',
+                confidence=0.85,
+                value=f"homoglyph:{matched_text}"
+            ))
         return matches
 
     def detect_mixed_scripts(self, text: str) -> List[PatternMatch]:
         """Detect mixed script usage (e.g., Latin + Cyrillic)."""
         matches = []
+        if text.isascii():
+            return matches
 
         # Detect Cyrillic mixed with Latin
-        for match in self.cyrillic_in_latin.finditer(text):
+        cyrillic_matches = ()
+        if self.cyrillic_char_pattern.search(text):
+            cyrillic_matches = self.cyrillic_in_latin.finditer(text)
+        for match in cyrillic_matches:
             matched_text = match.group(0)
             matches.append(PatternMatch(
                 offset=match.start(),
@@ -267,7 +307,10 @@ class ObfuscationDetector:
             ))
 
         # Detect Greek mixed with Latin
-        for match in self.greek_in_latin.finditer(text):
+        greek_matches = ()
+        if self.greek_char_pattern.search(text):
+            greek_matches = self.greek_in_latin.finditer(text)
+        for match in greek_matches:
             matched_text = match.group(0)
             matches.append(PatternMatch(
                 offset=match.start(),
@@ -298,27 +341,17 @@ class ObfuscationDetector:
         matches = []
 
         # Find sequences with combining marks
-        i = 0
-        while i < len(text):
-            if unicodedata.category(text[i]) in ['Mn', 'Mc', 'Me']:
-                # Found combining mark, look for the base char and all combining marks
-                start = max(0, i - 1)  # Include base character
-                while i < len(text) and unicodedata.category(text[i]) in ['Mn', 'Mc', 'Me']:
-                    i += 1
-
-                matched_text = text[start:i]
-                # Only report if there are multiple combining marks
-                mark_count = sum(1 for c in matched_text if unicodedata.category(c) in ['Mn', 'Mc', 'Me'])
-                if mark_count >= 2:
-                    matches.append(PatternMatch(
-                        offset=start,
-                        length=len(matched_text),
-                        type='obfuscation',
-                        confidence=0.75,
-                        value=f"combining_marks:{mark_count}"
-                    ))
-            else:
-                i += 1
+        marked = text.translate(_COMBINING_MARK_TABLE)
+        for match in self.combining_marks_pattern.finditer(marked):
+            start = max(0, match.start() - 1)  # Include base character
+            mark_count = match.end() - match.start()
+            matches.append(PatternMatch(
+                offset=start,
+                length=match.end() - start,
+                type='obfuscation',
+                confidence=0.75,
+                value=f"combining_marks:{mark_count}"
+            ))
 
         return matches
 
@@ -329,7 +362,7 @@ class ObfuscationDetector:
             matched_text = match.group(0)
 
             # Calculate confidence based on leet char density
-            leet_chars = sum(1 for c in matched_text if c in LEET_SPEAK_MAP)
+            leet_chars = len(matched_text) - len(matched_text.translate(_LEET_DELETE_TABLE))
             total_chars = len(matched_text)
             leet_ratio = leet_chars / total_chars if total_chars > 0 else 0
 
@@ -349,11 +382,7 @@ class ObfuscationDetector:
     def detect_unusual_spacing(self, text: str) -> List[PatternMatch]:
         """Detect unusual spacing patterns (e.g., 'h e l l o')."""
         matches = []
-
-        # Pattern: single char followed by space, repeated
-        spaced_pattern = re.compile(r'\b(\w\s){3,}\w\b')
-
-        for match in spaced_pattern.finditer(text):
+        for match in self.unusual_spacing_pattern.finditer(text):
             matched_text = match.group(0)
             # Remove spaces to check if it forms a word
             unspaced = matched_text.replace(' ', '')
@@ -371,7 +400,7 @@ class ObfuscationDetector:
         return matches
 
 
-def deobfuscate(text: str) -> str:
+def deobfuscate(text: str, keep_symbols: bool = False) -> str:
     """
     Apply all deobfuscation techniques to normalize text.
 
@@ -380,23 +409,34 @@ def deobfuscate(text: str) -> str:
 
     Args:
         text: Input text to deobfuscate
+        keep_symbols: Only map leet digits, leaving leet symbols ('@', '(',
+            '[', ...) in place for detectors that read them as separators
 
     Returns:
         Normalized text with obfuscation removed
     """
-    detector = ObfuscationDetector()
+    leet_table = _LEET_DIGIT_TABLE if keep_symbols else _LEET_SPEAK_TABLE
+
+    # Plain ASCII (the common case) has no zero-width, homoglyph, fullwidth
+    # or combining characters and is unchanged by NFD/NFKC: only leet applies
+    if text.isascii():
+        return text.translate(leet_table)
 
-    # Apply deobfuscation in order
-    text = detector.remove_zero_width_chars(text)
-    text = detector.normalize_homoglyphs(text)
-    text = detector.normalize_fullwidth(text)
-    text = detector.remove_combining_marks(text)
-    text = detector.normalize_leet_speak(text)
+    # Zero-width removal, homoglyph and fullwidth mapping in one pass
+    text = text.translate(_UNICODE_TABLE)
+
+    # Combining marks must go before leet mapping: NFD can expose ASCII
+    # leet characters (e.g. U+226E '≮' -> '<' + U+0338)
+    if not text.isascii():
+        text = unicodedata.normalize('NFD', text).translate(_NONSPACING_MARK_TABLE)
+    text = text.translate(leet_table)
 
     # Apply Unicode normalization (NFKC - compatibility composition)
-    text = unicodedata.normalize('NFKC', text)
+    return unicodedata.normalize('NFKC', text)
+
 
-    return text
+# Patterns are compiled once; the detector holds no per-call state
+_DETECTOR = ObfuscationDetector()
 
 
 def _deduplicate_matches(matches: List[PatternMatch]) -> List[PatternMatch]:
@@ -407,21 +447,16 @@ def _deduplicate_matches(matches: List[PatternMatch]) -> List[PatternMatch]:
     # Sort by position, then by confidence descending
     sorted_matches = sorted(matches, key=lambda m: (m.offset, -m.confidence))
 
+    # Accepted matches never overlap and arrive in offset order, so a
+    # candidate only has to clear the end of the last accepted match
     result = []
+    last_end = -1
     for match in sorted_matches:
-        # Check if this match overlaps with any accepted match
-        overlaps = False
-        for accepted in result:
-            # Check for overlap
-            if not (match.offset >= accepted.offset + accepted.length or
-                    match.offset + match.length <= accepted.offset):
-                overlaps = True
-                break
-
-        if not overlaps:
+        if match.offset >= last_end:
             result.append(match)
+            last_end = match.offset + match.length
 
-    return sorted(result, key=lambda m: m.offset)
+    return result
 
 
 def detect_obfuscation(text: str) -> List[PatternMatch]:
@@ -438,14 +473,17 @@ def detect_obfuscation(text: str) -> List[PatternMatch]:
         List of PatternMatch objects for detected obfuscation,
         deduplicated and sorted by offset
     """
-    detector = ObfuscationDetector()
+    detector = _DETECTOR
 
     all_matches = []
-    all_matches.extend(detector.detect_zero_width_chars(text))
-    all_matches.extend(detector.detect_homoglyphs(text))
-    all_matches.extend(detector.detect_mixed_scripts(text))
-    all_matches.extend(detector.detect_fullwidth(text))
-    all_matches.extend(detector.detect_combining_marks(text))
+    # Zero-width, homoglyph, mixed-script, fullwidth and combining characters
+    # are all non-ASCII: plain ASCII text can only contain leet and spacing
+    if not text.isascii():
+        all_matches.extend(detector.detect_zero_width_chars(text))
+        all_matches.extend(detector.detect_homoglyphs(text))
+        all_matches.extend(detector.detect_mixed_scripts(text))
+        all_matches.extend(detector.detect_fullwidth(text))
+        all_matches.extend(detector.detect_combining_marks(text))
     all_matches.extend(detector.detect_leet_speak(text))
     all_matches.extend(detector.detect_unusual_spacing(text))
 
@@ -8,10 +8,10 @@ with high precision and recall.
 
 import re
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class PatternMatch:
     """Represents a detected pattern match in text."""
     offset: int
@@ -43,6 +43,12 @@ PHONE_INDICATORS = [
     r'\b(?:tel|phone|mob|cell)[:.]?\b',
 ]
 
+# Every PHONE_INDICATORS match contains one of these (lowercase) terms
+PHONE_CONTEXT_TERMS = (
+    'call', 'text', 'phone', 'mob', 'cell', 'contact', 'reach',
+    'number', 'dial', 'ring', 'tel',
+)
+
 
 class PhoneDetector:
     """Detects phone numbers in various formats and obfuscations."""
@@ -72,24 +78,40 @@ class PhoneDetector:
 
         # Spaced digits: "5 5 5 1 2 3 4 5 6 7"
         self.spaced_digits_pattern = re.compile(
-            r'\b\d(?:\s+\d){6,14}\b'
+            r'\b\d(?:\s++\d){6,14}\b'
         )
 
         # Heavily spaced/separated: "5-5-5-1-2-3-4-5-6-7"
         self.separated_digits_pattern = re.compile(
-            r'\b\d(?:[\s.\-]+\d){6,14}\b'
+            r'\b\d(?:[\s.\-]++\d){6,14}\b'
+        )
+
+        # Digit words grouped by first letter so the engine tries one branch
+        # per position instead of every word, longest first within a group
+        # (e.g. t(?:hree|ree|wo|oo|o)) so "too" is not first matched as "to"
+        # and then backtracked when no separator follows. A word is always
+        # followed by a separator or \b, so only the whole word can match and
+        # the order never changes the result. Each pattern also checks the
+        # first character with a single class before trying any branch.
+        words_by_letter = {}
+        for word in sorted(DIGIT_WORDS, key=len, reverse=True):
+            words_by_letter.setdefault(word[0], []).append(word[1:])
+        digit_word_pattern = '|'.join(
+            f"{letter}(?:{'|'.join(rests)})" for letter, rests in words_by_letter.items()
         )
+        first_letters = ''.join(words_by_letter)
 
         # Spelled-out numbers: "five five five one two three"
-        digit_word_pattern = '|'.join(DIGIT_WORDS.keys())
         self.spelled_pattern = re.compile(
-            rf'\b(?:{digit_word_pattern})(?:[\s\-]+(?:{digit_word_pattern})){{6,14}}\b',
+            rf'\b(?=[{first_letters}])'
+            rf'(?:{digit_word_pattern})(?:[\s\-]++(?:{digit_word_pattern})){{6,14}}\b',
             re.IGNORECASE
         )
 
         # Mixed spelled and numeric: "call me at five five five 123 4567"
         self.mixed_pattern = re.compile(
-            rf'\b(?:\d|{digit_word_pattern})(?:[\s.\-]+(?:\d|{digit_word_pattern})){{6,14}}\b',
+            rf'\b(?=[\d{first_letters}])'
+            rf'(?:\d|{digit_word_pattern})(?:[\s.\-]++(?:\d|{digit_word_pattern})){{6,14}}\b',
             re.IGNORECASE
         )
 
@@ -99,6 +121,9 @@ class PhoneDetector:
             for pattern in PHONE_INDICATORS
         ]
 
+        # Any digit; the numeric formats can't match without one
+        self.digit_pattern = re.compile(r'\d')
+
     def _normalize_spelled_number(self, text: str) -> str:
         """Convert spelled-out numbers to digits."""
         words = text.lower().split()
@@ -113,7 +138,9 @@ class PhoneDetector:
 
     def _extract_digits(self, text: str) -> str:
         """Extract only digits from text."""
-        return re.sub(r'\D', '', text)
+        # str.isdecimal is exactly re's \d; cheaper than a regex sub on
+        # strings this short
+        return ''.join(filter(str.isdecimal, text))
 
     def _is_valid_phone_length(self, digits: str) -> bool:
         """Check if digit count is reasonable for a phone number."""
@@ -128,17 +155,30 @@ class PhoneDetector:
         end = min(len(text), match_pos + window)
         context = text[start:end]
 
+        # Substring prefilter, only exact for ASCII: IGNORECASE also folds
+        # e.g. dotless 'ı' to 'i'
+        if context.isascii():
+            lowered = context.lower()
+            if not any(term in lowered for term in PHONE_CONTEXT_TERMS):
+                return False
+
         for pattern in self.context_patterns:
             if pattern.search(context):
                 return True
         return False
 
     def _calculate_confidence(self, match_text: str, full_text: str,
-                             match_pos: int, pattern_type: str) -> float:
-        """Calculate confidence score for a phone match."""
+                             match_pos: int, pattern_type: str,
+                             digits: Optional[str] = None) -> float:
+        """Calculate confidence score for a phone match.
+
+        ``digits`` is ``_extract_digits(match_text)`` if the caller already
+        has it.
+        """
         confidence = 0.5  # Base confidence
 
-        digits = self._extract_digits(match_text)
+        if digits is None:
+            digits = self._extract_digits(match_text)
 
         # Boost for valid length
         if self._is_valid_phone_length(digits):
@@ -165,7 +205,7 @@ class PhoneDetector:
             confidence -= 0.1
 
         # Penalize repeated digits (555-5555, etc.)
-        if len(set(digits)) <= 3 and len(digits) >= 7:
+        if len(digits) >= 7 and len(set(digits)) <= 3:
             confidence -= 0.25
 
         return max(0.0, min(1.0, confidence))
@@ -179,7 +219,7 @@ class PhoneDetector:
 
             if self._is_valid_phone_length(digits):
                 confidence = self._calculate_confidence(
-                    matched_text, text, match.start(), 'international'
+                    matched_text, text, match.start(), 'international', digits
                 )
                 matches.append(PatternMatch(
                     offset=match.start(),
@@ -199,7 +239,7 @@ class PhoneDetector:
 
             if self._is_valid_phone_length(digits):
                 confidence = self._calculate_confidence(
-                    matched_text, text, match.start(), 'us_format'
+                    matched_text, text, match.start(), 'us_format', digits
                 )
                 matches.append(PatternMatch(
                     offset=match.start(),
@@ -219,7 +259,7 @@ class PhoneDetector:
 
             if self._is_valid_phone_length(digits):
                 confidence = self._calculate_confidence(
-                    matched_text, text, match.start(), 'spaced'
+                    matched_text, text, match.start(), 'spaced', digits
                 )
                 matches.append(PatternMatch(
                     offset=match.start(),
@@ -239,7 +279,7 @@ class PhoneDetector:
 
             if self._is_valid_phone_length(digits):
                 confidence = self._calculate_confidence(
-                    matched_text, text, match.start(), 'separated'
+                    matched_text, text, match.start(), 'separated', digits
                 )
                 matches.append(PatternMatch(
                     offset=match.start(),
@@ -296,6 +336,10 @@ class PhoneDetector:
         return matches
 
 
+# Patterns are compiled once; the detector holds no per-call state
+_DETECTOR = PhoneDetector()
+
+
 def _deduplicate_matches(matches: List[PatternMatch]) -> List[PatternMatch]:
     """Remove overlapping matches, keeping highest confidence."""
     if not matches:
@@ -304,21 +348,16 @@ def _deduplicate_matches(matches: List[PatternMatch]) -> List[PatternMatch]:
     # Sort by position, then by confidence descending
     sorted_matches = sorted(matches, key=lambda m: (m.offset, -m.confidence))
 
+    # Accepted matches never overlap and arrive in offset order, so a
+    # candidate only has to clear the end of the last accepted match
     result = []
+    last_end = -1
     for match in sorted_matches:
-        # Check if this match overlaps with any accepted match
-        overlaps = False
-        for accepted in result:
-            # Check for overlap
-            if not (match.offset >= accepted.offset + accepted.length or
-                    match.offset + match.length <= accepted.offset):
-                overlaps = True
-                break
-
-        if not overlaps:
+        if match.offset >= last_end:
             result.append(match)
+            last_end = match.offset + match.length
 
-    return sorted(result, key=lambda m: m.offset)
+    return result
 
 
 def detect(text: str) -> List[PatternMatch]:
@@ -332,13 +371,15 @@ def detect(text: str) -> List[PatternMatch]:
         List of PatternMatch objects for detected phone numbers,
         deduplicated and sorted by offset
     """
-    detector = PhoneDetector()
+    detector = _DETECTOR
 
     all_matches = []
-    all_matches.extend(detector.detect_international(text))
-    all_matches.extend(detector.detect_us_format(text))
-    all_matches.extend(detector.detect_spaced_digits(text))
-    all_matches.extend(detector.detect_separated_digits(text))
+    # Only the spelled-out and mixed formats can match without a digit
+    if detector.digit_pattern.search(text):
+        all_matches.extend(detector.detect_international(text))
+        all_matches.extend(detector.detect_us_format(text))
+        all_matches.extend(detector.detect_spaced_digits(text))
+        all_matches.extend(detector.detect_separated_digits(text))
     all_matches.extend(detector.detect_spelled_out(text))
     all_matches.extend(detector.detect_mixed_format(text))
 
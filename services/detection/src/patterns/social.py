@@ -8,10 +8,21 @@ Designed for production use with high precision and recall.
 
 import re
 from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 
+# Prefer RE2 (linear-time, no backtracking) for the gates that decide which
+# patterns run at all: one RE2::Set pass reports every pattern that can
+# match, far faster than the stdlib engine on long messages. Under RE2 the
+# gates may match more than the patterns do; the patterns themselves stay
+# on re, as they use lookaheads RE2 does not support. Falls back to re if
+# the optional dependency isn't installed.
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
 
-@dataclass
+
+@dataclass(slots=True)
 class PatternMatch:
     """Represents a detected pattern match in text."""
     offset: int
@@ -21,134 +32,203 @@ class PatternMatch:
     value: str
 
 
-# Platform-specific patterns and indicators
+# Platform-specific patterns and indicators. Each pattern comes with a
+# lowercase literal every match of it contains ('' if there is none), which
+# lets the gates rule it out in ASCII text with a plain substring check.
 PLATFORM_CONFIG = {
     'whatsapp': {
         'handles': [
-            r'\bwa\.me/[\w\d+]+',
-            r'\bwhatsapp\.com/[\w\d+]+',
-            r'\b(?:my\s+)?whatsapp\s+(?:is|number|:)\s*[+\d\s\-()]+',
+            (r'\bwa\.me/[\w\d+]+', 'wa.me/'),
+            (r'\bwhatsapp\.com/[\w\d+]+', 'whatsapp.com/'),
+            (r'\b(?:my\s+)?whatsapp\s+(?:is|number|:)\s*[+\d\s\-()]+', 'whatsapp'),
         ],
         'mentions': [
-            r'\b(?:whatsapp|wassup|whats\s*app|wa)\s+me\b',
-            r'\b(?:on|via|through)\s+(?:whatsapp|wa)\b',
-            r'\b(?:text|message|msg|contact)\s+(?:me\s+)?(?:on|via)\s+(?:whatsapp|wa)\b',
-            r'\b(?:add|reach|find)\s+(?:me\s+)?(?:on|via)\s+(?:whatsapp|wa)\b',
+            (r'\b(?:whatsapp|wassup|whats\s*app|wa)\s+me\b', 'me'),
+            (r'\b(?:on|via|through)\s+(?:whatsapp|wa)\b', ''),
+            (r'\b(?:text|message|msg|contact)\s+(?:me\s+)?(?:on|via)\s+(?:whatsapp|wa)\b', ''),
+            (r'\b(?:add|reach|find)\s+(?:me\s+)?(?:on|via)\s+(?:whatsapp|wa)\b', ''),
         ],
         'indicators': ['whatsapp', 'wa.me', 'wassup', 'wapp'],
     },
     'telegram': {
         'handles': [
-            r'\bt\.me/[\w\d_]+',
-            r'\btelegram\.me/[\w\d_]+',
-            r'\btelegram\.org/[\w\d_]+',
-            r'@[\w\d_]{5,32}(?!\w)',  # Telegram username format
+            (r'\bt\.me/[\w\d_]+', 't.me/'),
+            (r'\btelegram\.me/[\w\d_]+', 'telegram.me/'),
+            (r'\btelegram\.org/[\w\d_]+', 'telegram.org/'),
+            (r'@[\w\d_]{5,32}(?!\w)', '@'),  # Telegram username format
         ],
         'mentions': [
-            r'\b(?:telegram|tg)\s+me\b',
-            r'\b(?:on|via|through)\s+(?:telegram|tg)\b',
-            r'\b(?:text|message|msg|contact)\s+(?:me\s+)?(?:on|via)\s+(?:telegram|tg)\b',
-            r'\b(?:add|reach|find)\s+(?:me\s+)?(?:on|via)\s+(?:telegram|tg)\b',
-            r'\bmy\s+(?:telegram|tg)\s+(?:is|handle|username|:)\b',
+            (r'\b(?:telegram|tg)\s+me\b', 'me'),
+            (r'\b(?:on|via|through)\s+(?:telegram|tg)\b', ''),
+            (r'\b(?:text|message|msg|contact)\s+(?:me\s+)?(?:on|via)\s+(?:telegram|tg)\b', ''),
+            (r'\b(?:add|reach|find)\s+(?:me\s+)?(?:on|via)\s+(?:telegram|tg)\b', ''),
+            (r'\bmy\s+(?:telegram|tg)\s+(?:is|handle|username|:)\b', 'my'),
         ],
         'indicators': ['telegram', 't.me', 'tg', 'telegrm'],
     },
     'instagram': {
         'handles': [
-            r'\binstagram\.com/[\w\d_.]+',
-            r'\binstagr\.am/[\w\d_.]+',
-            r'@[\w\d_.]{1,30}(?!\w)',  # Instagram username format
+            (r'\binstagram\.com/[\w\d_.]+', 'instagram.com/'),
+            (r'\binstagr\.am/[\w\d_.]+', 'instagr.am/'),
+            (r'@[\w\d_.]{1,30}(?!\w)', '@'),  # Instagram username format
         ],
         'mentions': [
-            r'\b(?:instagram|insta|ig)\s+me\b',
-            r'\b(?:on|via|through)\s+(?:instagram|insta|ig)\b',
-            r'\b(?:follow|dm|message|msg)\s+(?:me\s+)?(?:on|via)\s+(?:instagram|insta|ig)\b',
-            r'\b(?:add|find)\s+(?:me\s+)?(?:on|via)\s+(?:instagram|insta|ig)\b',
-            r'\bmy\s+(?:instagram|insta|ig)\s+(?:is|handle|username|:)\b',
+            (r'\b(?:instagram|insta|ig)\s+me\b', 'me'),
+            (r'\b(?:on|via|through)\s+(?:instagram|insta|ig)\b', ''),
+            (r'\b(?:follow|dm|message|msg)\s+(?:me\s+)?(?:on|via)\s+(?:instagram|insta|ig)\b', ''),
+            (r'\b(?:add|find)\s+(?:me\s+)?(?:on|via)\s+(?:instagram|insta|ig)\b', ''),
+            (r'\bmy\s+(?:instagram|insta|ig)\s+(?:is|handle|username|:)\b', 'my'),
         ],
         'indicators': ['instagram', 'insta', 'ig', 'instagr'],
     },
     'snapchat': {
         'handles': [
-            r'\bsnapchat\.com/add/[\w\d_.]+',
+            (r'\bsnapchat\.com/add/[\w\d_.]+', 'snapchat.com/add/'),
         ],
         'mentions': [
-            r'\b(?:snapchat|snap)\s+me\b',
-            r'\b(?:on|via|through)\s+(?:snapchat|snap)\b',
-            r'\b(?:add|message|msg|contact)\s+(?:me\s+)?(?:on|via)\s+(?:snapchat|snap)\b',
-            r'\bmy\s+(?:snapchat|snap)\s+(?:is|handle|username|:)\b',
-            r'\badd\s+me\s+(?:on\s+)?snap\b',
+            (r'\b(?:snapchat|snap)\s+me\b', 'me'),
+            (r'\b(?:on|via|through)\s+(?:snapchat|snap)\b', ''),
+            (r'\b(?:add|message|msg|contact)\s+(?:me\s+)?(?:on|via)\s+(?:snapchat|snap)\b', ''),
+            (r'\bmy\s+(?:snapchat|snap)\s+(?:is|handle|username|:)\b', 'my'),
+            (r'\badd\s+me\s+(?:on\s+)?snap\b', 'snap'),
         ],
         'indicators': ['snapchat', 'snap', 'snapcht'],
     },
     'signal': {
         'handles': [
-            r'\bsignal\.org/[\w\d+]+',
-            r'\bsignal\.me/[\w\d+]+',
+            (r'\bsignal\.org/[\w\d+]+', 'signal.org/'),
+            (r'\bsignal\.me/[\w\d+]+', 'signal.me/'),
         ],
         'mentions': [
-            r'\b(?:signal|sig)\s+me\b',
-            r'\b(?:on|via|through)\s+(?:signal|sig)\b',
-            r'\b(?:text|message|msg|contact)\s+(?:me\s+)?(?:on|via)\s+(?:signal|sig)\b',
-            r'\bmy\s+(?:signal|sig)\s+(?:is|number|:)\b',
+            (r'\b(?:signal|sig)\s+me\b', 'me'),
+            (r'\b(?:on|via|through)\s+(?:signal|sig)\b', ''),
+            (r'\b(?:text|message|msg|contact)\s+(?:me\s+)?(?:on|via)\s+(?:signal|sig)\b', ''),
+            (r'\bmy\s+(?:signal|sig)\s+(?:is|number|:)\b', 'my'),
         ],
         'indicators': ['signal', 'sig'],
     },
     'discord': {
         'handles': [
-            r'\bdiscord\.gg/[\w\d]+',
-            r'\bdiscord\.com/invite/[\w\d]+',
-            r'[\w\d_]{2,32}#\d{4}',  # Discord tag format username#1234
+            (r'\bdiscord\.gg/[\w\d]+', 'discord.gg/'),
+            (r'\bdiscord\.com/invite/[\w\d]+', 'discord.com/invite/'),
+            (r'[\w\d_]{2,32}#\d{4}', '#'),  # Discord tag format username#1234
         ],
         'mentions': [
-            r'\b(?:discord|disc)\s+me\b',
-            r'\b(?:on|via|through)\s+(?:discord|disc)\b',
-            r'\b(?:message|msg|dm|contact)\s+(?:me\s+)?(?:on|via)\s+(?:discord|disc)\b',
-            r'\bmy\s+(?:discord|disc)\s+(?:is|tag|username|:)\b',
-            r'\bjoin\s+(?:my\s+)?discord\b',
+            (r'\b(?:discord|disc)\s+me\b', 'me'),
+            (r'\b(?:on|via|through)\s+(?:discord|disc)\b', ''),
+            (r'\b(?:message|msg|dm|contact)\s+(?:me\s+)?(?:on|via)\s+(?:discord|disc)\b', ''),
+            (r'\bmy\s+(?:discord|disc)\s+(?:is|tag|username|:)\b', 'my'),
+            (r'\bjoin\s+(?:my\s+)?discord\b', 'discord'),
         ],
         'indicators': ['discord', 'disc', 'discrd'],
     },
     'messenger': {
         'handles': [
-            r'\bm\.me/[\w\d.]+',
-            r'\bmessenger\.com/t/[\w\d.]+',
-            r'\bfb\.me/[\w\d.]+',
+            (r'\bm\.me/[\w\d.]+', 'm.me/'),
+            (r'\bmessenger\.com/t/[\w\d.]+', 'messenger.com/t/'),
+            (r'\bfb\.me/[\w\d.]+', 'fb.me/'),
         ],
         'mentions': [
-            r'\b(?:facebook\s+)?messenger\s+me\b',
-            r'\b(?:on|via|through)\s+(?:facebook\s+)?messenger\b',
-            r'\b(?:message|msg|contact)\s+(?:me\s+)?(?:on|via)\s+(?:facebook\s+)?messenger\b',
-            r'\bfb\s+(?:message|msg|me)\b',
+            (r'\b(?:facebook\s+)?messenger\s+me\b', 'messenger'),
+            (r'\b(?:on|via|through)\s+(?:facebook\s+)?messenger\b', 'messenger'),
+            (r'\b(?:message|msg|contact)\s+(?:me\s+)?(?:on|via)\s+(?:facebook\s+)?messenger\b', 'messenger'),
+            (r'\bfb\s+(?:message|msg|me)\b', 'fb'),
         ],
         'indicators': ['messenger', 'fb.me', 'm.me', 'facebook'],
     },
     'tiktok': {
         'handles': [
-            r'\btiktok\.com/@[\w\d_.]+',
-            r'@[\w\d_.]{2,24}(?!\w)',  # TikTok username format
+            (r'\btiktok\.com/@[\w\d_.]+', 'tiktok.com/@'),
+            (r'@[\w\d_.]{2,24}(?!\w)', '@'),  # TikTok username format
         ],
         'mentions': [
-            r'\b(?:tiktok|tik\s*tok|tt)\s+me\b',
-            r'\b(?:on|via|through)\s+(?:tiktok|tik\s*tok|tt)\b',
-            r'\b(?:follow|message|dm)\s+(?:me\s+)?(?:on|via)\s+(?:tiktok|tik\s*tok|tt)\b',
-            r'\bmy\s+(?:tiktok|tik\s*tok|tt)\s+(?:is|handle|username|:)\b',
+            (r'\b(?:tiktok|tik\s*tok|tt)\s+me\b', 'me'),
+            (r'\b(?:on|via|through)\s+(?:tiktok|tik\s*tok|tt)\b', ''),
+            (r'\b(?:follow|message|dm)\s+(?:me\s+)?(?:on|via)\s+(?:tiktok|tik\s*tok|tt)\b', ''),
+            (r'\bmy\s+(?:tiktok|tik\s*tok|tt)\s+(?:is|handle|username|:)\b', 'my'),
         ],
         'indicators': ['tiktok', 'tik tok', 'tt'],
     },
 }
 
-# Generic patterns
+
+class _GateTable(dict):
+    """str.translate table for the text the gates run over under RE2.
+
+    Maps text 1:1 so that RE2's ASCII-only \\w, \\d, \\s and \\b match at
+    least wherever stdlib re's Unicode ones would: other word characters
+    become '0' (digits) or '_', whitespace becomes a space, and the four
+    non-ASCII letters case-insensitive re equates with ASCII ones become
+    those letters. RE2 only accepts valid UTF-8, so lone surrogates are
+    replaced too. Entries are filled in the first time a code point is
+    looked up; only BMP results are kept.
+    """
+
+    _CASE_FOLDED = {
+        '\u0131': 'i',  # dotless i
+        '\u0130': 'I',  # I with dot above
+        '\u017f': 's',  # long s
+        '\u212a': 'K',  # Kelvin sign
+    }
+
+    def __missing__(self, code: int):
+        char = chr(code)
+        if char in self._CASE_FOLDED:
+            value = ord(self._CASE_FOLDED[char])
+        elif 0xD800 <= code < 0xE000:
+            value = 0xFFFD
+        elif char.isspace():
+            value = ord(' ')
+        elif code < 0x80:
+            value = code
+        elif char.isdecimal():
+            value = ord('0')
+        elif char.isalnum():
+            value = ord('_')
+        else:
+            value = code
+        if code <= 0xFFFF:
+            self[code] = value
+        return value
+
+
+_GATE_TABLE = _GateTable()
+
+
+def _gate_pattern(pattern: str) -> str:
+    """A pattern as added to the RE2 gate set.
+
+    RE2 has no lookaheads; dropping the ``(?!\\w)`` ones only widens the gate.
+    """
+    return pattern.replace(r'(?!\w)', '')
+
+
+# Generic patterns, with their required literals as in PLATFORM_CONFIG
 GENERIC_DM_PATTERNS = [
-    r'\bdm\s+me\b',
-    r'\bslide\s+into\s+(?:my\s+)?dms?\b',
-    r'\bhit\s+(?:up\s+)?(?:my\s+)?dms?\b',
-    r'\bcheck\s+(?:your\s+)?dms?\b',
-    r'\bmessage\s+me\s+(?:directly|privately|private)\b',
-    r'\btext\s+me\s+(?:directly|privately|private)\b',
-    r'\bcontact\s+me\s+(?:directly|privately|off\s*[-\s]*platform)\b',
+    (r'\bdm\s+me\b', 'dm'),
+    (r'\bslide\s+into\s+(?:my\s+)?dms?\b', 'slide'),
+    (r'\bhit\s+(?:up\s+)?(?:my\s+)?dms?\b', 'hit'),
+    (r'\bcheck\s+(?:your\s+)?dms?\b', 'check'),
+    (r'\bmessage\s+me\s+(?:directly|privately|private)\b', 'message'),
+    (r'\btext\s+me\s+(?:directly|privately|private)\b', 'text'),
+    (r'\bcontact\s+me\s+(?:directly|privately|off\s*[-\s]*platform)\b', 'contact'),
 ]
 
+# Link-like handles ('.me/', '.com/', '.gg/', '.org/' in any case)
+_URL_MARKER_PATTERN = re.compile(r'\.(?:me|com|gg|org)/', re.IGNORECASE)
+
+# Context phrases indicating off-platform contact, for platform matches
+OFF_PLATFORM_PHRASES = (
+    'off platform', 'outside of here', 'not here',
+    'reach me', 'contact me', 'find me', 'add me'
+)
+
+# Context phrases indicating off-platform contact, for generic DM requests
+DM_OFF_PLATFORM_PHRASES = ('off platform', 'outside', 'not here', 'privately')
+
+# @username that might be a social handle (only kept with platform context)
+AT_MENTION_PATTERN = (r'@[\w\d_]{3,30}(?!\w)', '@')
+
 
 class SocialDetector:
     """Detects social media platform mentions and handles."""
@@ -160,27 +240,128 @@ class SocialDetector:
         """Compile all regex patterns for social platform detection."""
         self.platform_patterns: Dict[str, Dict[str, List[re.Pattern]]] = {}
 
+        # Every pattern also gets an id, its index in the order detect() runs
+        # them; _candidates() narrows a text down to the ids that may match.
+        # sources holds (pattern, required literal) by id.
+        sources: List[Tuple[str, str]] = []
+        self.platform_pattern_ids: Dict[str, Dict[str, List[int]]] = {}
+
         for platform, config in PLATFORM_CONFIG.items():
             self.platform_patterns[platform] = {
                 'handles': [
                     re.compile(pattern, re.IGNORECASE)
-                    for pattern in config['handles']
+                    for pattern, _ in config['handles']
                 ],
                 'mentions': [
                     re.compile(pattern, re.IGNORECASE)
-                    for pattern in config['mentions']
+                    for pattern, _ in config['mentions']
                 ],
             }
+            self.platform_pattern_ids[platform] = {}
+            for group in ('handles', 'mentions'):
+                self.platform_pattern_ids[platform][group] = list(
+                    range(len(sources), len(sources) + len(config[group]))
+                )
+                sources.extend(config[group])
 
         # Compile generic DM patterns
         self.generic_patterns = [
             re.compile(pattern, re.IGNORECASE)
-            for pattern in GENERIC_DM_PATTERNS
+            for pattern, _ in GENERIC_DM_PATTERNS
+        ]
+        self.generic_pattern_ids = list(
+            range(len(sources), len(sources) + len(GENERIC_DM_PATTERNS))
+        )
+        sources.extend(GENERIC_DM_PATTERNS)
+
+        # Indicators per platform, in PLATFORM_CONFIG order
+        self.platform_indicators: Dict[str, Tuple[str, ...]] = {
+            platform: tuple(config['indicators'])
+            for platform, config in PLATFORM_CONFIG.items()
+        }
+
+        # Every platform indicator in one alternation, so a context window
+        # without any platform mention is ruled out in a single pass
+        self.indicator_pattern = re.compile('|'.join(
+            re.escape(indicator)
+            for indicators in self.platform_indicators.values()
+            for indicator in indicators
+        ))
+
+        # Pattern for @username (must have platform context nearby)
+        self.at_pattern = re.compile(AT_MENTION_PATTERN[0], re.IGNORECASE)
+        self.at_pattern_id = len(sources)
+        sources.append(AT_MENTION_PATTERN)
+
+        self._compile_gates(sources)
+
+    def _compile_gates(self, sources: List[Tuple[str, str]]):
+        """Compile the gates _candidates() checks a text against.
+
+        With RE2, one RE2::Set over every pattern reports in a single pass
+        which of them match. Without it, one alternation over every pattern
+        rules out most messages, and one per platform group (plus the
+        generic DM patterns and the @mention pattern) narrows the rest down
+        to whole groups; in ASCII text, a pattern whose required literal
+        (e.g. "wa.me/") is absent is dropped with a plain substring check.
+        """
+        if _regex is not re:
+            self.pattern_set = _regex.Set.SearchSet()
+            for source, _ in sources:
+                self.pattern_set.Add('(?i)' + _gate_pattern(source))
+            self.pattern_set.Compile()
+            return
+
+        def alternation(ids):
+            return re.compile('|'.join(f'(?:{sources[i][0]})' for i in ids), re.IGNORECASE)
+
+        self.pattern_set = None
+        self.anchors = [literal for _, literal in sources]
+        self.any_gate = alternation(range(len(sources)))
+        groups = [
+            ids for platform_ids in self.platform_pattern_ids.values()
+            for ids in platform_ids.values()
         ]
+        groups += [self.generic_pattern_ids, [self.at_pattern_id]]
+        self.group_gates = [(alternation(ids), ids) for ids in groups]
+
+    def _candidates(self, text: str) -> Set[int]:
+        """Ids of the patterns that may match ``text``; no other pattern can."""
+        if self.pattern_set is not None:
+            return set(self.pattern_set.Match(text.translate(_GATE_TABLE)) or ())
+        if not self.any_gate.search(text):
+            return set()
+        text_lower = self._lower_text(text)
+        candidates = set()
+        for gate, ids in self.group_gates:
+            if text_lower is not None:
+                ids = [i for i in ids if self.anchors[i] in text_lower]
+            if ids and gate.search(text):
+                candidates.update(ids)
+        return candidates
+
+    def _lower_text(self, text: str) -> Optional[str]:
+        """``text.lower()`` if it keeps every offset (ASCII text), else None.
+
+        Context windows are then sliced from it instead of lowercased one by
+        one; otherwise (e.g. "\u0130" lowercases to two characters) each
+        window is lowercased on its own.
+        """
+        return text.lower() if text.isascii() else None
+
+    def _context(self, text: str, text_lower: Optional[str],
+                 start: int, end: int) -> str:
+        """Lowercased ``text[start:end]``, clamped to the text."""
+        start = max(0, start)
+        end = min(len(text), end)
+        if text_lower is not None:
+            return text_lower[start:end]
+        return text[start:end].lower()
 
     def _calculate_confidence(self, match_text: str, full_text: str,
                              match_pos: int, platform: str,
-                             match_type: str) -> float:
+                             match_type: str,
+                             text_lower: Optional[str] = None) -> float:
         """Calculate confidence score for a social media match."""
         confidence = 0.5  # Base confidence
 
@@ -193,7 +374,7 @@ class SocialDetector:
             confidence += 0.2
 
         # Boost for URL-like patterns
-        if any(c in match_text.lower() for c in ['.me/', '.com/', '.gg/', '.org/']):
+        if _URL_MARKER_PATTERN.search(match_text):
             confidence += 0.15
 
         # Boost for @ mentions
@@ -201,21 +382,16 @@ class SocialDetector:
             confidence += 0.1
 
         # Check for platform name near match
-        window_start = max(0, match_pos - 40)
-        window_end = min(len(full_text), match_pos + len(match_text) + 40)
-        context = full_text[window_start:window_end].lower()
+        context = self._context(
+            full_text, text_lower, match_pos - 40, match_pos + len(match_text) + 40
+        )
 
-        if platform in PLATFORM_CONFIG:
-            indicators = PLATFORM_CONFIG[platform]['indicators']
-            if any(indicator in context for indicator in indicators):
-                confidence += 0.15
+        indicators = self.platform_indicators.get(platform, ())
+        if any(indicator in context for indicator in indicators):
+            confidence += 0.15
 
         # Boost for phrases indicating off-platform contact
-        off_platform_phrases = [
-            'off platform', 'outside of here', 'not here',
-            'reach me', 'contact me', 'find me', 'add me'
-        ]
-        if any(phrase in context for phrase in off_platform_phrases):
+        if any(phrase in context for phrase in OFF_PLATFORM_PHRASES):
             confidence += 0.1
 
         # Penalize very short handles without clear context
@@ -224,21 +400,44 @@ class SocialDetector:
 
         return max(0.0, min(1.0, confidence))
 
-    def detect_platform(self, text: str, platform: str) -> List[PatternMatch]:
-        """Detect mentions and handles for a specific platform."""
+    def _context_platform(self, context: str) -> Optional[str]:
+        """Return the first platform, in PLATFORM_CONFIG order, with an indicator in context."""
+        if not self.indicator_pattern.search(context):
+            return None
+        return next(
+            platform for platform, indicators in self.platform_indicators.items()
+            if any(indicator in context for indicator in indicators)
+        )
+
+    def detect_platform(self, text: str, platform: str,
+                        candidates: Optional[Set[int]] = None,
+                        text_lower: Optional[str] = None) -> List[PatternMatch]:
+        """Detect mentions and handles for a specific platform.
+
+        ``candidates`` and ``text_lower`` are ``_candidates(text)`` and
+        ``_lower_text(text)``, for callers running several detectors on the
+        same text; they are computed when omitted.
+        """
         matches = []
 
         if platform not in self.platform_patterns:
             return matches
 
         patterns = self.platform_patterns[platform]
+        pattern_ids = self.platform_pattern_ids[platform]
+        if candidates is None:
+            candidates = self._candidates(text)
+        if text_lower is None:
+            text_lower = self._lower_text(text)
 
         # Detect handle patterns
-        for pattern in patterns['handles']:
+        for pattern_id, pattern in zip(pattern_ids['handles'], patterns['handles']):
+            if pattern_id not in candidates:
+                continue
             for match in pattern.finditer(text):
                 matched_text = match.group(0)
                 confidence = self._calculate_confidence(
-                    matched_text, text, match.start(), platform, 'handle'
+                    matched_text, text, match.start(), platform, 'handle', text_lower
                 )
 
                 if confidence > 0.4:
@@ -251,11 +450,13 @@ class SocialDetector:
                     ))
 
         # Detect mention patterns
-        for pattern in patterns['mentions']:
+        for pattern_id, pattern in zip(pattern_ids['mentions'], patterns['mentions']):
+            if pattern_id not in candidates:
+                continue
             for match in pattern.finditer(text):
                 matched_text = match.group(0)
                 confidence = self._calculate_confidence(
-                    matched_text, text, match.start(), platform, 'mention'
+                    matched_text, text, match.start(), platform, 'mention', text_lower
                 )
 
                 if confidence > 0.5:
@@ -269,11 +470,19 @@ class SocialDetector:
 
         return matches
 
-    def detect_generic_dm(self, text: str) -> List[PatternMatch]:
+    def detect_generic_dm(self, text: str,
+                          candidates: Optional[Set[int]] = None,
+                          text_lower: Optional[str] = None) -> List[PatternMatch]:
         """Detect generic DM/contact requests."""
         matches = []
-
-        for pattern in self.generic_patterns:
+        if candidates is None:
+            candidates = self._candidates(text)
+        if text_lower is None:
+            text_lower = self._lower_text(text)
+
+        for pattern_id, pattern in zip(self.generic_pattern_ids, self.generic_patterns):
+            if pattern_id not in candidates:
+                continue
             for match in pattern.finditer(text):
                 matched_text = match.group(0)
 
@@ -281,22 +490,14 @@ class SocialDetector:
                 confidence = 0.6  # Base confidence for generic DM
 
                 # Check for platform context nearby
-                window_start = max(0, match.start() - 50)
-                window_end = min(len(text), match.end() + 50)
-                context = text[window_start:window_end].lower()
+                context = self._context(text, text_lower, match.start() - 50, match.end() + 50)
 
                 # Boost if there's platform mention nearby
-                has_platform_context = False
-                for platform, config in PLATFORM_CONFIG.items():
-                    if any(indicator in context for indicator in config['indicators']):
-                        has_platform_context = True
-                        confidence += 0.15
-                        break
+                if self.indicator_pattern.search(context):
+                    confidence += 0.15
 
                 # Boost for off-platform indicators
-                if any(phrase in context for phrase in [
-                    'off platform', 'outside', 'not here', 'privately'
-                ]):
+                if any(phrase in context for phrase in DM_OFF_PLATFORM_PHRASES):
                     confidence += 0.1
 
                 if confidence > 0.5:
@@ -310,35 +511,31 @@ class SocialDetector:
 
         return matches
 
-    def detect_at_mentions(self, text: str) -> List[PatternMatch]:
+    def detect_at_mentions(self, text: str,
+                           candidates: Optional[Set[int]] = None,
+                           text_lower: Optional[str] = None) -> List[PatternMatch]:
         """
         Detect @username patterns that might be social handles.
         This is intentionally conservative to avoid false positives.
         """
         matches = []
+        if candidates is None:
+            candidates = self._candidates(text)
+        if self.at_pattern_id not in candidates:
+            return matches
+        if text_lower is None:
+            text_lower = self._lower_text(text)
 
-        # Pattern for @username (must have platform context nearby)
-        at_pattern = re.compile(r'@[\w\d_]{3,30}(?!\w)', re.IGNORECASE)
-
-        for match in at_pattern.finditer(text):
+        for match in self.at_pattern.finditer(text):
             matched_text = match.group(0)
 
             # Check for platform context within 50 chars
-            window_start = max(0, match.start() - 50)
-            window_end = min(len(text), match.end() + 50)
-            context = text[window_start:window_end].lower()
+            context = self._context(text, text_lower, match.start() - 50, match.end() + 50)
 
             # Only accept if there's platform context
-            has_context = False
-            detected_platform = None
-
-            for platform, config in PLATFORM_CONFIG.items():
-                if any(indicator in context for indicator in config['indicators']):
-                    has_context = True
-                    detected_platform = platform
-                    break
+            detected_platform = self._context_platform(context)
 
-            if has_context:
+            if detected_platform is not None:
                 confidence = 0.65  # Moderate confidence for context-based @mention
 
                 # Boost for specific platform indicators
@@ -356,6 +553,10 @@ class SocialDetector:
         return matches
 
 
+# Patterns are compiled once; the detector holds no per-call state
+_DETECTOR = SocialDetector()
+
+
 def _deduplicate_matches(matches: List[PatternMatch]) -> List[PatternMatch]:
     """Remove overlapping matches, keeping highest confidence."""
     if not matches:
@@ -364,21 +565,16 @@ def _deduplicate_matches(matches: List[PatternMatch]) -> List[PatternMatch]:
     # Sort by position, then by confidence descending
     sorted_matches = sorted(matches, key=lambda m: (m.offset, -m.confidence))
 
+    # Accepted matches never overlap and arrive in offset order, so a
+    # candidate only has to clear the end of the last accepted match
     result = []
+    last_end = -1
     for match in sorted_matches:
-        # Check if this match overlaps with any accepted match
-        overlaps = False
-        for accepted in result:
-            # Check for overlap
-            if not (match.offset >= accepted.offset + accepted.length or
-                    match.offset + match.length <= accepted.offset):
-                overlaps = True
-                break
-
-        if not overlaps:
+        if match.offset >= last_end:
             result.append(match)
+            last_end = match.offset + match.length
 
-    return sorted(result, key=lambda m: m.offset)
+    return result
 
 
 def detect(text: str) -> List[PatternMatch]:
@@ -392,18 +588,24 @@ def detect(text: str) -> List[PatternMatch]:
         List of PatternMatch objects for detected social media references,
         deduplicated and sorted by offset
     """
-    detector = SocialDetector()
+    detector = _DETECTOR
+
+    # Most messages mention no platform at all: one pass rules them out
+    candidates = detector._candidates(text)
+    if not candidates:
+        return []
 
     all_matches = []
+    text_lower = detector._lower_text(text)
 
     # Detect platform-specific patterns
     for platform in PLATFORM_CONFIG.keys():
-        all_matches.extend(detector.detect_platform(text, platform))
+        all_matches.extend(detector.detect_platform(text, platform, candidates, text_lower))
 
     # Detect generic DM patterns
-    all_matches.extend(detector.detect_generic_dm(text))
+    all_matches.extend(detector.detect_generic_dm(text, candidates, text_lower))
 
     # Detect @mentions with context
-    all_matches.extend(detector.detect_at_mentions(text))
+    all_matches.extend(detector.detect_at_mentions(text, candidates, text_lower))
 
     return _deduplicate_matches(all_matches)
@@ -10,8 +10,16 @@ import re
 from dataclasses import dataclass
 from typing import List, Set
 
+# Prefer RE2 (linear-time, no backtracking) for the match patterns: the
+# stdlib engine retries every alternative of the domain alternations at each
+# word boundary. Falls back to re if the optional dependency isn't installed.
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
 
-@dataclass
+
+@dataclass(slots=True)
 class PatternMatch:
     """Represents a detected pattern match in text."""
     offset: int
@@ -40,6 +48,13 @@ SOCIAL_DOMAINS = {
     'viber.com', 'kik.com', 'skype.com', 'zoom.us'
 }
 
+# Whitespace to Python's \s that RE2's ASCII-only \s misses
+_RE2_EXTRA_SPACES = '\v\x1c\x1d\x1e\x1f'
+_RE2_SPACE_TABLE = str.maketrans(_RE2_EXTRA_SPACES, ' ' * len(_RE2_EXTRA_SPACES))
+
+# Brackets dropped from a domain before reading its TLD
+_BRACKET_DELETE_TABLE = str.maketrans('', '', '[]()')
+
 # URL-related indicators for context
 URL_INDICATORS = [
     r'\b(?:check\s+out|visit|go\s+to|see|view|click|open)\b',
@@ -48,6 +63,21 @@ URL_INDICATORS = [
 ]
 
 
+def _domain_alternation(domains: Set[str]) -> str:
+    """Regex alternation matching any of ``domains`` literally."""
+    # Longest first, so a domain is never cut short by one that prefixes it
+    return '|'.join(re.escape(domain) for domain in sorted(domains, key=lambda d: (-len(d), d)))
+
+
+def _re2_text(text: str) -> str:
+    """ASCII ``text`` with the whitespace RE2's \\s misses mapped to spaces."""
+    # The mapping is 1:1, so offsets into the original text still hold
+    for char in _RE2_EXTRA_SPACES:
+        if char in text:
+            return text.translate(_RE2_SPACE_TABLE)
+    return text
+
+
 class URLDetector:
     """Detects URLs in various formats and obfuscations."""
 
@@ -74,23 +104,15 @@ class URLDetector:
         )
 
         # Link shorteners (more specific pattern)
-        shortener_domains = '|'.join(
-            re.escape(domain.replace('.', r'\.'))
-            for domain in SHORTENER_DOMAINS
-        )
         self.shortener_pattern = re.compile(
-            rf'\b(?:https?://)?(?:www\.)?(?:{shortener_domains})'
+            rf'\b(?:https?://)?(?:www\.)?(?:{_domain_alternation(SHORTENER_DOMAINS)})\b'
             r'(?:/[a-zA-Z0-9\-_]+)?',
             re.IGNORECASE
         )
 
         # Social platform URLs (specific)
-        social_domains = '|'.join(
-            re.escape(domain.replace('.', r'\.'))
-            for domain in SOCIAL_DOMAINS
-        )
         self.social_url_pattern = re.compile(
-            rf'\b(?:https?://)?(?:www\.)?(?:{social_domains})'
+            rf'\b(?:https?://)?(?:www\.)?(?:{_domain_alternation(SOCIAL_DOMAINS)})\b'
             r'(?:/[a-zA-Z0-9\-._~:/?#\[\]@!$&\'()*+,;=%]*)?',
             re.IGNORECASE
         )
@@ -116,6 +138,39 @@ class URLDetector:
             re.IGNORECASE
         )
 
+        # The match patterns, in the order detect() runs them
+        self.match_patterns = (
+            self.full_url_pattern, self.shortener_pattern, self.social_url_pattern,
+            self.no_protocol_pattern, self.domain_mention_pattern,
+            self.obfuscated_url_pattern, self.bracket_dot_pattern,
+        )
+
+        # On ASCII text the RE2 and stdlib engines agree on these patterns
+        # (once _re2_text() has mapped RE2's missing whitespace to spaces), so
+        # ASCII input takes an RE2 twin; anything else keeps the re semantics
+        # for Unicode \b and case folding. One RE2::Set over the twins reports
+        # in a single pass which of them match at all.
+        self.re2_patterns = {}
+        self.pattern_set = None
+        if _regex is not re:
+            self.pattern_set = _regex.Set.SearchSet()
+            for pattern in self.match_patterns:
+                self.re2_patterns[pattern] = _regex.compile('(?i)' + pattern.pattern)
+                self.pattern_set.Add('(?i)' + pattern.pattern)
+            self.pattern_set.Compile()
+
+        # URL separators for _normalize_url, in one pass: "dot" becomes ".",
+        # "slash" becomes "/", and spaces around . / : are dropped
+        self.separator_pattern = re.compile(
+            r'(?P<dot>\s*[\[\(]?\s*dot\s*[\]\)]?\s*)'
+            r'|(?P<slash>\s*[\[\(]?\s*slash\s*[\]\)]?\s*)'
+            r'|\s*(?P<sep>[./:])\s*'
+        )
+
+        # Domain/TLD extraction
+        self.url_prefix_pattern = re.compile(r'(?:(?:https?|ftp)://)?(?:www\.)?', re.IGNORECASE)
+        self.spaced_dot_pattern = re.compile(r'\s*dot\s*')
+
         # Context patterns for confidence boosting
         self.context_patterns = [
             re.compile(pattern, re.IGNORECASE)
@@ -132,6 +187,31 @@ class URLDetector:
             'me', 'tv', 'cc', 'ws', 'be', 'at', 'ch', 'dk'
         }
 
+    def _mentions_domain(self, text: str, domains: Set[str]) -> bool:
+        """Cheap literal check before running a domain alternation over ``text``.
+
+        Only used without RE2, which already matches the alternation in one
+        linear pass. Non-ASCII text always passes: case-insensitive matching
+        equates a few non-ASCII letters with ASCII ones.
+        """
+        if self.re2_patterns or not text.isascii():
+            return True
+        text_lower = text.lower()
+        return any(domain in text_lower for domain in domains)
+
+    def _candidates(self, text: str) -> Set[int]:
+        """Indexes into match_patterns that may match ``text``; no other one can."""
+        if self.pattern_set is None or not text.isascii():
+            return set(range(len(self.match_patterns)))
+        return set(self.pattern_set.Match(_re2_text(text)) or ())
+
+    def _finditer(self, pattern: re.Pattern, text: str):
+        """Iterate ``pattern`` over ``text``, on RE2 where that is equivalent."""
+        re2_pattern = self.re2_patterns.get(pattern)
+        if re2_pattern is None or not text.isascii():
+            return pattern.finditer(text)
+        return re2_pattern.finditer(_re2_text(text))
+
     def _has_url_context(self, text: str, match_pos: int, window: int = 30) -> bool:
         """Check if there's URL-related context near the match."""
         start = max(0, match_pos - window)
@@ -145,58 +225,47 @@ class URLDetector:
 
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        # Remove protocol
-        url = re.sub(r'^(?:https?|ftp)://', '', url, flags=re.IGNORECASE)
-
-        # Remove www
-        url = re.sub(r'^www\.', '', url, flags=re.IGNORECASE)
+        # Remove protocol and www
+        url = url[self.url_prefix_pattern.match(url).end():]
 
         # Get domain part (before first slash or end)
-        domain = url.split('/')[0]
+        domain = url.partition('/')[0]
 
         return domain.lower()
 
     def _extract_tld(self, domain: str) -> str:
-        """Extract TLD from domain."""
+        """Extract TLD from a domain already lowercased by _extract_domain."""
         # Normalize obfuscation
-        domain = domain.lower()
-        domain = re.sub(r'\s*dot\s*', '.', domain)
-        domain = re.sub(r'[\[\]\(\)]', '', domain)
+        if 'dot' in domain:
+            domain = self.spaced_dot_pattern.sub('.', domain)
+        domain = domain.translate(_BRACKET_DELETE_TABLE)
 
-        parts = domain.split('.')
-        if parts:
-            return parts[-1].strip()
-        return ''
+        return domain.rpartition('.')[2].strip()
 
     def _is_valid_tld(self, tld: str) -> bool:
-        """Check if TLD is valid."""
-        tld = tld.lower().strip()
+        """Check if TLD is valid (as returned by _extract_tld)."""
         return tld in self.common_tlds or (len(tld) >= 2 and tld.isalpha())
 
     def _is_shortener(self, domain: str) -> bool:
-        """Check if domain is a known URL shortener."""
-        domain = domain.lower().strip()
-        return domain in SHORTENER_DOMAINS
+        """Check if a domain from _extract_domain is a known URL shortener."""
+        return domain.strip() in SHORTENER_DOMAINS
 
     def _is_social_platform(self, domain: str) -> bool:
-        """Check if domain is a known social platform."""
-        domain = domain.lower().strip()
-        return domain in SOCIAL_DOMAINS
+        """Check if a domain from _extract_domain is a known social platform."""
+        return domain.strip() in SOCIAL_DOMAINS
 
     def _normalize_url(self, text: str) -> str:
         """Normalize obfuscated URL to standard format."""
-        normalized = text.lower()
-
-        # Replace "dot" with .
-        normalized = re.sub(r'\s*[\[\(]?\s*dot\s*[\]\)]?\s*', '.', normalized)
+        return self.separator_pattern.sub(self._normalize_separator, text.lower())
 
-        # Replace "slash" with /
-        normalized = re.sub(r'\s*[\[\(]?\s*slash\s*[\]\)]?\s*', '/', normalized)
-
-        # Remove extra spaces around special chars
-        normalized = re.sub(r'\s*([./:])\s*', r'\1', normalized)
-
-        return normalized
+    def _normalize_separator(self, match: re.Match) -> str:
+        """Replacement for one separator_pattern match."""
+        kind = match.lastgroup
+        if kind == 'dot':
+            return '.'
+        if kind == 'slash':
+            return '/'
+        return match.group('sep')
 
     def _calculate_confidence(self, match_text: str, full_text: str,
                              match_pos: int, pattern_type: str) -> float:
@@ -246,8 +315,8 @@ class URLDetector:
     def detect_full_urls(self, text: str) -> List[PatternMatch]:
         """Detect full URLs with protocol."""
         matches = []
-        for match in self.full_url_pattern.finditer(text):
-            matched_text = match.group(0)
+        for match in self._finditer(self.full_url_pattern, text):
+            matched_text = text[match.start():match.end()]
 
             confidence = self._calculate_confidence(
                 matched_text, text, match.start(), 'full'
@@ -266,8 +335,8 @@ class URLDetector:
     def detect_no_protocol(self, text: str) -> List[PatternMatch]:
         """Detect URLs without protocol."""
         matches = []
-        for match in self.no_protocol_pattern.finditer(text):
-            matched_text = match.group(0)
+        for match in self._finditer(self.no_protocol_pattern, text):
+            matched_text = text[match.start():match.end()]
 
             # Filter out common false positives
             domain = self._extract_domain(matched_text)
@@ -296,8 +365,10 @@ class URLDetector:
     def detect_shorteners(self, text: str) -> List[PatternMatch]:
         """Detect known URL shortener links."""
         matches = []
-        for match in self.shortener_pattern.finditer(text):
-            matched_text = match.group(0)
+        if not self._mentions_domain(text, SHORTENER_DOMAINS):
+            return matches
+        for match in self._finditer(self.shortener_pattern, text):
+            matched_text = text[match.start():match.end()]
 
             confidence = self._calculate_confidence(
                 matched_text, text, match.start(), 'shortener'
@@ -318,8 +389,10 @@ class URLDetector:
     def detect_social_urls(self, text: str) -> List[PatternMatch]:
         """Detect social platform URLs."""
         matches = []
-        for match in self.social_url_pattern.finditer(text):
-            matched_text = match.group(0)
+        if not self._mentions_domain(text, SOCIAL_DOMAINS):
+            return matches
+        for match in self._finditer(self.social_url_pattern, text):
+            matched_text = text[match.start():match.end()]
 
             confidence = self._calculate_confidence(
                 matched_text, text, match.start(), 'social'
@@ -340,8 +413,8 @@ class URLDetector:
     def detect_domain_mentions(self, text: str) -> List[PatternMatch]:
         """Detect domain mentions with 'dot' spelled out."""
         matches = []
-        for match in self.domain_mention_pattern.finditer(text):
-            matched_text = match.group(0)
+        for match in self._finditer(self.domain_mention_pattern, text):
+            matched_text = text[match.start():match.end()]
 
             confidence = self._calculate_confidence(
                 matched_text, text, match.start(), 'mention'
@@ -360,8 +433,8 @@ class URLDetector:
     def detect_obfuscated(self, text: str) -> List[PatternMatch]:
         """Detect obfuscated URLs."""
         matches = []
-        for match in self.obfuscated_url_pattern.finditer(text):
-            matched_text = match.group(0)
+        for match in self._finditer(self.obfuscated_url_pattern, text):
+            matched_text = text[match.start():match.end()]
 
             confidence = self._calculate_confidence(
                 matched_text, text, match.start(), 'obfuscated'
@@ -380,8 +453,8 @@ class URLDetector:
     def detect_bracket_obfuscation(self, text: str) -> List[PatternMatch]:
         """Detect bracket-obfuscated URLs."""
         matches = []
-        for match in self.bracket_dot_pattern.finditer(text):
-            matched_text = match.group(0)
+        for match in self._finditer(self.bracket_dot_pattern, text):
+            matched_text = text[match.start():match.end()]
 
             confidence = self._calculate_confidence(
                 matched_text, text, match.start(), 'bracket'
@@ -398,6 +471,10 @@ class URLDetector:
         return matches
 
 
+# Patterns are compiled once; the detector holds no per-call state
+_DETECTOR = URLDetector()
+
+
 def _deduplicate_matches(matches: List[PatternMatch]) -> List[PatternMatch]:
     """Remove overlapping matches, keeping highest confidence."""
     if not matches:
@@ -406,21 +483,16 @@ def _deduplicate_matches(matches: List[PatternMatch]) -> List[PatternMatch]:
     # Sort by position, then by confidence descending
     sorted_matches = sorted(matches, key=lambda m: (m.offset, -m.confidence))
 
+    # Accepted matches never overlap and arrive in offset order, so a
+    # candidate only has to clear the end of the last accepted match
     result = []
+    last_end = -1
     for match in sorted_matches:
-        # Check if this match overlaps with any accepted match
-        overlaps = False
-        for accepted in result:
-            # Check for overlap
-            if not (match.offset >= accepted.offset + accepted.length or
-                    match.offset + match.length <= accepted.offset):
-                overlaps = True
-                break
-
-        if not overlaps:
+        if match.offset >= last_end:
             result.append(match)
+            last_end = match.offset + match.length
 
-    return sorted(result, key=lambda m: m.offset)
+    return result
 
 
 def detect(text: str) -> List[PatternMatch]:
@@ -434,15 +506,20 @@ def detect(text: str) -> List[PatternMatch]:
         List of PatternMatch objects for detected URLs,
         deduplicated and sorted by offset
     """
-    detector = URLDetector()
-
+    detector = _DETECTOR
+    detectors = (
+        detector.detect_full_urls,
+        detector.detect_shorteners,
+        detector.detect_social_urls,
+        detector.detect_no_protocol,
+        detector.detect_domain_mentions,
+        detector.detect_obfuscated,
+        detector.detect_bracket_obfuscation,
+    )
+
+    # Skip the detectors whose pattern cannot match at all
     all_matches = []
-    all_matches.extend(detector.detect_full_urls(text))
-    all_matches.extend(detector.detect_shorteners(text))
-    all_matches.extend(detector.detect_social_urls(text))
-    all_matches.extend(detector.detect_no_protocol(text))
-    all_matches.extend(detector.detect_domain_mentions(text))
-    all_matches.extend(detector.detect_obfuscated(text))
-    all_matches.extend(detector.detect_bracket_obfuscation(text))
+    for pattern_id in sorted(detector._candidates(text)):
+        all_matches.extend(detectors[pattern_id](text))
 
     return _deduplicate_matches(all_matches)
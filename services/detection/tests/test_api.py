@@ -2,13 +2,16 @@
 
 import pytest
 from httpx import AsyncClient, ASGITransport
+from src.engine.pipeline import DetectionPipeline
 from src.main import app
 
 
 @pytest.fixture
-def client():
-    transport = ASGITransport(app=app)
-    return AsyncClient(transport=transport, base_url="http://test")
+async def client():
+    # ASGITransport does not send lifespan events; run startup explicitly
+    async with app.router.lifespan_context(app):
+        transport = ASGITransport(app=app)
+        yield AsyncClient(transport=transport, base_url="http://test")
 
 
 class TestHealthCheck:
@@ -22,6 +25,17 @@ class TestHealthCheck:
         assert data["service"] == "detection"
 
 
+class TestLifespan:
+    @pytest.mark.asyncio
+    async def test_shutdown_closes_pipeline(self, monkeypatch):
+        closed = []
+        monkeypatch.setattr(DetectionPipeline, "close", lambda self: closed.append(self))
+        async with app.router.lifespan_context(app):
+            pipeline = app.state.pipeline
+            assert not closed
+        assert closed == [pipeline]
+
+
 class TestAnalyzeEndpoint:
     @pytest.mark.asyncio
     async def test_analyze_clean(self, client):
@@ -1,12 +1,21 @@
 """Tests for individual pattern detection modules."""
 
+import re
+
 import pytest
+from src.patterns import email as email_module
 from src.patterns.phone import detect as detect_phone
-from src.patterns.email import detect as detect_email
-from src.patterns.url import detect as detect_url
-from src.patterns.social import detect as detect_social
+from src.patterns.email import EmailDetector, detect as detect_email
+from src.patterns.url import URLDetector, detect as detect_url
+from src.patterns.social import (
+    AT_MENTION_PATTERN,
+    GENERIC_DM_PATTERNS,
+    PLATFORM_CONFIG,
+    SocialDetector,
+    detect as detect_social,
+)
 from src.patterns.obfuscation import deobfuscate, detect_obfuscation
-from src.patterns.intent_phrases import detect as detect_intent
+from src.patterns.intent_phrases import IntentDetector, detect as detect_intent
 
 
 class TestPhonePatterns:
@@ -66,6 +75,45 @@ class TestEmailPatterns:
         email_matches = [m for m in matches if m.type == "email"]
         assert len(email_matches) == 0
 
+    def test_standard_offsets_after_nfkc_expansion(self):
+        # "\ufb03" (ffi ligature) normalizes to three characters
+        text = "\ufb03ce: user@example.com"
+        matches = EmailDetector().detect_standard(text)
+        assert len(matches) == 1
+        m = matches[0]
+        assert text[m.offset:m.offset + m.length] == "user@example.com"
+
+    def test_standard_confidence_ignores_at_dot_substrings(self):
+        # "at"/"dot" inside a plain address are not obfuscated separators
+        plain = detect_email("john@gmail.com")[0].confidence
+        assert detect_email("kate@gmail.com")[0].confidence == plain
+        assert detect_email("matt.doty@gmail.com")[0].confidence == plain
+
+    def test_non_breaking_space_separators(self):
+        text = "user\u00a0[at]\u00a0example\u00a0[dot]\u00a0com"
+        matches = detect_email(text)
+        assert len(matches) == 1
+        assert matches[0].value == text
+
+    def test_lone_surrogate(self):
+        matches = detect_email("user@example.com \ud800")
+        assert len(matches) == 1
+
+    @pytest.mark.parametrize("text", [
+        "reply to my dmoff platform. \u0130. na\u00efve",
+        "\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7JOHN.DOE@EXAMPLE.COM",
+        "email me johnatmail.co.org\u00df!",
+        "my email: a at mail.co. uk\u00df!",
+        "caf\u00e9 user [at] example [dot] com\u00e9 or user@example.com\u00e9",
+    ])
+    def test_same_matches_without_re2(self, monkeypatch, text):
+        # RE2's \b is ASCII-only; stdlib re's is Unicode-aware
+        pytest.importorskip("re2")
+        with_re2 = detect_email(text)
+        monkeypatch.setattr(email_module, "_regex", re)
+        monkeypatch.setattr(email_module, "_DETECTOR", EmailDetector())
+        assert detect_email(text) == with_re2
+
 
 class TestUrlPatterns:
     def test_full_url(self):
@@ -81,10 +129,22 @@ class TestUrlPatterns:
         matches = detect_url("Link: bit.ly/abc123")
         assert len(matches) >= 1
 
+    def test_known_domain_patterns(self):
+        detector = URLDetector()
+        shorteners = detector.detect_shorteners("Link: bit.ly/abc123 or x.com")
+        assert [m.value for m in shorteners] == ["bit.ly/abc123"]
+        social = detector.detect_social_urls("add me: wa.me/15551234567")
+        assert [m.value for m in social] == ["wa.me/15551234567"]
+
     def test_spelled_domain(self):
         matches = detect_url("go to example dot com")
         assert len(matches) >= 1
 
+    def test_unusual_whitespace(self):
+        # \v is whitespace to Python's \s but not to RE2's
+        matches = detect_url("go to example\vdot\vcom")
+        assert [m.value for m in matches] == ["example\vdot\vcom"]
+
 
 class TestSocialPatterns:
     def test_whatsapp(self):
@@ -108,6 +168,55 @@ class TestSocialPatterns:
         matches = detect_social("just DM me directly")
         assert len(matches) >= 1
 
+    def test_non_ascii_handle(self):
+        matches = detect_social("ping me: wa.me/\u0436\u043e\u0440\u0430")
+        assert [m.value for m in matches] == ["wa.me/\u0436\u043e\u0440\u0430"]
+
+    def test_patterns_do_not_capture(self):
+        # Only group(0) is ever read; capturing groups just cost match time
+        detector = SocialDetector()
+        patterns = [
+            pattern
+            for groups in detector.platform_patterns.values()
+            for group in groups.values()
+            for pattern in group
+        ]
+        patterns += [*detector.generic_patterns, detector.at_pattern]
+        assert all(pattern.groups == 0 for pattern in patterns)
+
+    def test_required_literals(self):
+        # The gates drop a pattern whose literal is missing from ASCII text
+        corpus = [
+            "My WhatsApp is +1 555 123 4567, or wa.me/15551234567 and whatsapp.com/Joe",
+            "WhatsApp me, Telegram me, Insta me, Snap me, Signal me",
+            "Discord me, Messenger me, TikTok me",
+            "t.me/joe_doe telegram.me/joe telegram.org/joe @joe_doe_99 my TG is joe",
+            "instagram.com/joe.doe instagr.am/joe @joe.doe MY IG is joe",
+            "snapchat.com/add/joe.doe my snap is joe, add me on snap",
+            "signal.org/joe signal.me/+1555 my Signal number: 555",
+            "discord.gg/abc discord.com/invite/abc joe#1234 my disc tag: joe, join my Discord",
+            "m.me/joe messenger.com/t/joe fb.me/joe via facebook messenger, msg me on Messenger, FB msg",
+            "tiktok.com/@joe.doe my tik tok handle is joe",
+            "DM me, slide into my DMs, hit up my dm, check your DMs",
+            "message me privately, text me directly, contact me off-platform",
+        ]
+        pairs = [
+            pair for config in PLATFORM_CONFIG.values()
+            for group in ("handles", "mentions")
+            for pair in config[group]
+        ]
+        pairs += [*GENERIC_DM_PATTERNS, AT_MENTION_PATTERN]
+        for source, literal in pairs:
+            if not literal:
+                continue
+            values = [
+                match.group(0).lower()
+                for text in corpus
+                for match in re.finditer(source, text, re.IGNORECASE)
+            ]
+            assert values, source
+            assert all(literal in value for value in values), source
+
 
 class TestObfuscation:
     def test_zero_width_removal(self):
@@ -130,6 +239,11 @@ class TestObfuscation:
         matches = detect_obfuscation(text)
         assert len(matches) >= 1
 
+    def test_mixed_script(self):
+        text = "p\u0430ypal"  # Cyrillic "\u0430"
+        matches = detect_obfuscation(text)
+        assert [m.value for m in matches] == [f"mixed_script:cyrillic:{text}"]
+
 
 class TestIntentPhrases:
     def test_direct_request(self):
@@ -149,3 +263,15 @@ class TestIntentPhrases:
         matches = detect_intent("The weather is nice today")
         intent_matches = [m for m in matches if m.type == "intent"]
         assert len(intent_matches) == 0
+
+    def test_compound_offset_after_long_separator(self):
+        text = "Thanks for the order.  hmu asap"
+        matches = IntentDetector().detect_compound_intent(text)
+        assert len(matches) == 1
+        m = matches[0]
+        assert text[m.offset:m.offset + m.length] == "hmu asap"
+
+    def test_unusual_whitespace(self):
+        # \v is whitespace to Python's \s but not to RE2's
+        matches = detect_intent("hit\vme\vup")
+        assert len(matches) >= 1
@@ -1,8 +1,18 @@
 """Tests for the detection pipeline orchestrator."""
 
 import pytest
-from src.models import AnalyzeRequest
-from src.engine.pipeline import DetectionPipeline
+from src.models import AnalyzeRequest, StageResult
+from src.engine import pipeline as pipeline_module
+from src.engine.pipeline import DetectionPipeline, _run_stage1_cached, _stage1_cache
+from src.engine.stage1_rules import hash_token, run_stage1
+from src.engine.stage2_nlp import _INTENT_CLUSTERS, _entity_analysis
+from src.engine.stage3_behavioral import BehavioralContext, RedisBehavioralContext, run_stage3
+
+
+@pytest.fixture
+def redis_client():
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeRedis(decode_responses=True)
 
 
 @pytest.fixture
@@ -133,6 +143,90 @@ class TestPipeline:
         assert result.risk_score >= 0.50
         assert len(result.labels) >= 2
 
+    @pytest.mark.asyncio
+    async def test_stage1_cached_for_repeated_content(self, pipeline):
+        req = AnalyzeRequest(
+            message_id="test-11",
+            thread_id="thread-1",
+            user_id="user-1",
+            content="Repeated canned reply, call 555-987-6543",
+        )
+        first = await pipeline.analyze(req)
+        hits = _stage1_cache.cache_info().hits
+        second = await pipeline.analyze(req)
+        assert _stage1_cache.cache_info().hits == hits + 1
+        assert second.risk_score == first.risk_score
+
+    def test_stage1_cache_returns_copies(self):
+        text = "Cached copy check, call 555-987-6543"
+        first = _run_stage1_cached(text)
+        expected = first.model_dump()
+        first.labels.append("tampered")
+        first.evidence_spans[0].offset = -1
+        first.hashed_tokens.clear()
+        assert _run_stage1_cached(text).model_dump() == expected
+
+    @pytest.mark.asyncio
+    async def test_conclusive_stage1_skips_stage3(self, monkeypatch, pipeline):
+        def fail_stage3(*args):
+            raise AssertionError("Stage 3 ran")
+
+        monkeypatch.setattr(pipeline_module, "run_stage3", fail_stage3)
+        req = AnalyzeRequest(
+            message_id="test-12",
+            thread_id="thread-1",
+            user_id="user-1",
+            content="Call me at 555-123-4567 or email john@example.com",
+        )
+        result = await pipeline.analyze(req)
+        assert result.stage < 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("s1_score", [0.90, 1.0])
+    @pytest.mark.parametrize("s2_score", [0.0, 0.7, 1.0])
+    async def test_shortcircuit_scores_stage3_as_zero(self, monkeypatch, s1_score, s2_score):
+        # Skipping Stage 3 must not move the score (and so the policy decision)
+        # away from what a full run with a Stage 3 score of 0 gives
+        async def fake_stage2(text, context_texts):
+            return StageResult(stage=2, score=s2_score)
+
+        monkeypatch.setattr(
+            pipeline_module, "_run_stage1_cached", lambda text: StageResult(stage=1, score=s1_score)
+        )
+        monkeypatch.setattr(pipeline_module, "run_stage2", fake_stage2)
+        monkeypatch.setattr(
+            pipeline_module, "run_stage3", lambda *args: StageResult(stage=3, score=0.0)
+        )
+        req = AnalyzeRequest(
+            message_id="test-14",
+            thread_id="thread-1",
+            user_id="user-1",
+            content="Call me at 555-123-4567",
+        )
+        shortcircuit = await DetectionPipeline(shortcircuit_threshold=0.90).analyze(req)
+        full = await DetectionPipeline(shortcircuit_threshold=1.1).analyze(req)
+        assert shortcircuit.risk_score == full.risk_score
+        assert shortcircuit.labels == full.labels
+
+    @pytest.mark.asyncio
+    async def test_shortcircuit_disabled(self, monkeypatch):
+        calls = []
+
+        def fake_stage3(*args):
+            calls.append(args)
+            return StageResult(stage=3, score=0.0)
+
+        monkeypatch.setattr(pipeline_module, "run_stage3", fake_stage3)
+        pipeline = DetectionPipeline(shortcircuit_threshold=1.1)
+        req = AnalyzeRequest(
+            message_id="test-13",
+            thread_id="thread-1",
+            user_id="user-1",
+            content="Call me at 555-123-4567 or email john@example.com",
+        )
+        await pipeline.analyze(req)
+        assert len(calls) == 1
+
 
 class TestAdversarialPatterns:
     """Adversarial test suite for obfuscation and evasion attempts."""
@@ -190,3 +284,143 @@ class TestAdversarialPatterns:
         )
         result = await pipeline.analyze(req)
         assert result.risk_score < 0.40
+
+
+class TestStage1:
+    def test_one_evidence_span_per_type_and_offset(self):
+        result = run_stage1("call 5\u200b55-123-4567 or 555-123-4567, mail j\u043ehn@gmail.com")
+        keys = [(e.type, e.offset) for e in result.evidence_spans]
+        assert len(keys) == len(set(keys))
+        assert len(result.hashed_tokens) == len(set(result.hashed_tokens))
+
+    def test_leet_phone(self):
+        result = run_stage1("f1ve f1ve f1ve 0ne tw0 thr33 f0ur")
+        assert "phone_number" in result.labels
+        assert result.score >= 0.6
+
+    def test_leet_phone_with_intent(self):
+        result = run_stage1("call me at f1ve f1ve f1ve 0ne tw0 thr33 f0ur")
+        assert "phone_number" in result.labels
+        assert result.score >= 0.75
+
+    def test_leet_email(self):
+        result = run_stage1("j0hn at gmail dot c0m")
+        assert "email_address" in result.labels
+        assert "url_link" in result.labels
+        assert result.score >= 0.8
+
+    def test_url_on_clean_ascii_text(self):
+        result = run_stage1("youtube.com/@creator")
+        assert "url_link" in result.labels
+        assert result.score >= 0.75
+
+    def test_leet_number_is_not_a_url(self):
+        # "555.123.4567" deobfuscates to "sss.ize.asb7", which looks like a host
+        for text in ("call 555.123.4567 now", "price 4.99 or 12.50"):
+            assert "url_link" not in run_stage1(text).labels
+        assert "phone_number" in run_stage1("call 555.123.4567 now").labels
+
+    def test_leet_symbols_stay_separators(self):
+        # Mapping '@' -> 'a' and '(' -> 'c' would leave no address to find
+        result = run_stage1("j\u200bohn@gm\u200bail.com")
+        assert hash_token("john@gmail.com") in result.hashed_tokens
+        assert "email_address" in run_stage1("j0hn (at) gmail (dot) c0m").labels
+
+
+class TestStage2:
+    def test_intent_clusters_compile_under_re2(self):
+        re2 = pytest.importorskip("re2")
+        for cluster in _INTENT_CLUSTERS.values():
+            for pattern in cluster["keywords"]:
+                re2.compile(f"(?i){pattern}")
+
+    def test_entity_long_digit_run(self):
+        assert _entity_analysis("ring 555 123 4567 tonight") == 0.5
+
+    def test_entity_name_near_contact_verb(self):
+        assert _entity_analysis("please text Maria about the job") == 0.4
+
+    def test_entity_ignores_sentence_initial_capital(self):
+        assert _entity_analysis("Please call the office tomorrow") == 0.0
+
+
+class TestBehavioralContext:
+    def test_lookup_does_not_create_history(self):
+        ctx = BehavioralContext()
+        assert ctx.get_history("u1", "t1").detection_count == 0
+        assert ctx.get_thread_count("u1") == 0
+
+    def test_record_tracks_threads_and_counts(self):
+        ctx = BehavioralContext()
+        ctx.record("u1", "t1", ["phone"])
+        ctx.record("u1", "t1", ["email"])
+        ctx.record("u1", "t2", ["phone"])
+        assert ctx.get_history("u1", "t1").detection_count == 2
+        assert ctx.get_history("u1", "t1").types_seen == {"phone", "email"}
+        assert ctx.get_thread_count("u1") == 2
+        assert ctx.get_global_count("u1") == 3
+
+
+class TestRedisBehavioralContext:
+    def test_lookup_does_not_create_history(self, redis_client):
+        ctx = RedisBehavioralContext(client=redis_client)
+        history, global_count, thread_count = ctx.lookup("u1", "t1")
+        assert history.detection_count == 0
+        assert history.types_seen == set()
+        assert (global_count, thread_count) == (0, 0)
+        assert redis_client.keys() == []
+
+    def test_record_round_trip(self, redis_client):
+        ctx = RedisBehavioralContext(client=redis_client)
+        ctx.record("u1", "t1", ["phone"])
+        ctx.record("u1", "t1", ["email"])
+        ctx.record("u1", "t2", [])
+        history, global_count, thread_count = ctx.lookup("u1", "t1")
+        assert history.detection_count == 2
+        assert history.message_count == 2
+        assert history.types_seen == {"phone", "email"}
+        assert history.last_detection_ts > 0
+        assert (global_count, thread_count) == (3, 2)
+        assert ctx.get_history("u1", "t1") == history
+        assert ctx.get_global_count("u1") == 3
+        assert ctx.get_thread_count("u1") == 2
+
+    def test_record_expires_every_key(self, redis_client):
+        ctx = RedisBehavioralContext(client=redis_client, window_seconds=120)
+        ctx.record("u1", "t1", ["phone"])
+        keys = {
+            "cis:bh:u1:t:t1",
+            "cis:bh:u1:t:t1:types",
+            "cis:bh:u1:threads",
+            "cis:bh:u1:global",
+        }
+        assert set(redis_client.keys()) == keys
+        assert all(0 < redis_client.ttl(key) <= 120 for key in keys)
+
+    def test_thread_keys_do_not_collide_with_user_keys(self, redis_client):
+        ctx = RedisBehavioralContext(client=redis_client)
+        ctx.record("u1", "threads", ["phone"])
+        ctx.record("u1", "global", ["email"])
+        history, global_count, thread_count = ctx.lookup("u1", "global")
+        assert history.detection_count == 1
+        assert history.types_seen == {"email"}
+        assert (global_count, thread_count) == (2, 2)
+
+    def test_fails_open_when_redis_is_down(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        server.connected = False
+        ctx = RedisBehavioralContext(
+            client=fakeredis.FakeRedis(server=server, decode_responses=True)
+        )
+        ctx.record("u1", "t1", ["phone"])
+        history, global_count, thread_count = ctx.lookup("u1", "t1")
+        assert history.detection_count == 0
+        assert (global_count, thread_count) == (0, 0)
+        assert run_stage3("call me", "u1", "t1", ctx).score == 0.0
+
+    def test_close_releases_connections(self, redis_client, monkeypatch):
+        closed = []
+        monkeypatch.setattr(redis_client, "close", lambda: closed.append(True))
+        RedisBehavioralContext(client=redis_client).close()
+        assert closed == [True]